@@ -0,0 +1,72 @@
+"""
+Binance REST client used by all MCP tools.
+
+Thin subclass of python-binance's Client that decodes response bodies with
+orjson when it is installed, falling back to the stock json decoding otherwise,
+and sizes its keep-alive connection pool for concurrent tool calls.
+
+A single instance is created in main.py and shared by every registered tool,
+so all calls reuse the same pooled HTTPS connections.
+"""
+
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from binance.client import Client
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Per-request timeout (seconds) applied to every Binance REST call
+DEFAULT_REQUEST_TIMEOUT = 10
+
+# Keep-alive connections held per host; sized for concurrent tool calls and fan-out
+POOL_SIZE = 50
+
+
+class FastJsonClient(Client):
+    """python-binance Client with a pooled, timed-out session and orjson response parsing."""
+
+    def __init__(self, api_key: str, api_secret: str, **kwargs):
+        kwargs.setdefault('requests_params', {'timeout': DEFAULT_REQUEST_TIMEOUT})
+        super().__init__(api_key, api_secret, **kwargs)
+
+    def _init_session(self) -> requests.Session:
+        session = super()._init_session()
+        # Retry only idempotent reads on connection errors and gateway failures;
+        # order placement (POST/DELETE) is never retried automatically
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET'}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+        session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    def _handle_response(response: requests.Response):
+        if orjson is None:
+            return Client._handle_response(response)
+
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+
+        # Parse the raw bytes directly; skips requests' charset detection and stdlib json
+        body = response.content
+        if not body:
+            return {}
+
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise BinanceRequestException("Invalid Response: %s" % response.text)
@@ -7,6 +7,7 @@ import pandas as pd
 from binance.client import Client
 from typing import Optional
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_futures_conditional_orders import invalidate_conditional_orders_cache
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +117,9 @@ def cancel_algo_order_operation(binance_client: Client, symbol: str, algo_id: Op
             })
             logger.info(f"Cancelled algo order with clientAlgoId={client_algo_id}")
 
+        # Any cached open algo orders still include the cancelled ones
+        invalidate_conditional_orders_cache()
+
         # Create DataFrame
         df = pd.DataFrame(records)
 
@@ -7,6 +7,9 @@ import pandas as pd
 from binance.client import Client
 from typing import Optional
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_futures_balances import invalidate_futures_balances_cache
+from binance_tools.get_futures_conditional_orders import invalidate_conditional_orders_cache
+from binance_tools.get_futures_open_orders import invalidate_open_orders_cache
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,8 @@ def cancel_futures_order_operation(binance_client: Client, symbol: str, order_id
             # Cancel all open futures orders for symbol
             logger.warning(f"⚠️  CANCELLING ALL OPEN FUTURES ORDERS for {symbol}")
             result = binance_client.futures_cancel_all_open_orders(symbol=symbol)
+            # Cancel-all also removes the symbol's conditional (TP/SL) orders
+            invalidate_conditional_orders_cache()
 
             # Result format is a dict with code and msg
             records.append({
@@ -77,6 +82,11 @@ def cancel_futures_order_operation(binance_client: Client, symbol: str, order_id
             })
             logger.info(f"Cancelled futures order {order_id}")
 
+        # Any cached open orders still include the cancelled ones, and cached
+        # balances still count their locked margin
+        invalidate_open_orders_cache()
+        invalidate_futures_balances_cache()
+
         # Create DataFrame
         df = pd.DataFrame(records)
 
@@ -7,6 +7,7 @@ import pandas as pd
 from binance.client import Client
 from typing import Optional
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_account import invalidate_account_cache
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +104,9 @@ def cancel_order_operation(binance_client: Client, symbol: str, order_id: Option
             })
             logger.info(f"Cancelled order {order_id}")
 
+        # Any cached account balances still show the cancelled orders' locked funds
+        invalidate_account_cache()
+
         # Create DataFrame
         df = pd.DataFrame(records)
 
@@ -7,6 +7,8 @@ from request_logger import log_request
 import pandas as pd
 from binance.client import Client
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_futures_balances import invalidate_futures_balances_cache
+from binance_tools.get_futures_open_orders import invalidate_open_orders_cache
 from .validation_helpers import validate_futures_margin
 
 logger = logging.getLogger(__name__)
@@ -87,6 +89,10 @@ def execute_futures_limit_order(binance_client: Client, symbol: str, side: str,
         # Execute the order
         logger.warning(f"⚠️  PLACING REAL FUTURES LIMIT ORDER: {side} {quantity} {symbol} @ {price}")
         order = binance_client.futures_create_order(**params)
+        # Any cached open orders no longer include this one, and cached
+        # balances predate the margin it locks
+        invalidate_open_orders_cache()
+        invalidate_futures_balances_cache()
         logger.info(f"Futures limit order placed. Order ID: {order['orderId']}, Status: {order['status']}")
 
         # Create record
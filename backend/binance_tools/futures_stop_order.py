@@ -1,11 +1,13 @@
 import logging
 from datetime import datetime
 import uuid
-from mcp_service import format_csv_response
+from mcp_service import format_csv_response, submit_csv_write
 from request_logger import log_request
 import pandas as pd
 from binance.client import Client
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_futures_conditional_orders import invalidate_conditional_orders_cache
+from binance_tools.get_futures_open_orders import invalidate_open_orders_cache
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +40,7 @@ def execute_futures_stop_order(binance_client: Client, symbol: str, side: str,
     Returns:
         DataFrame with order placement details
     """
-    logger.info(f"Placing futures {order_type} order for {symbol}")
+    logger.info("Placing futures %s order for %s", order_type, symbol)
 
     # Validate side
     side = side.upper()
@@ -100,12 +102,16 @@ def execute_futures_stop_order(binance_client: Client, symbol: str, side: str,
             params['quantity'] = quantity
 
         # Execute the order
-        logger.warning(f"PLACING FUTURES {order_type}: {side} {symbol} position_side={position_side}")
+        logger.warning("PLACING FUTURES %s: %s %s position_side=%s", order_type, side, symbol, position_side)
         order = binance_client.futures_create_order(**params)
+        # Cached open orders no longer include this one (it is listed as a
+        # basic or an algo order depending on its type)
+        invalidate_conditional_orders_cache()
+        invalidate_open_orders_cache()
 
         # Handle both basic orders (orderId) and algo orders (algoId)
         order_id = order.get('orderId') or order.get('algoId')
-        logger.info(f"Futures stop order placed. Order ID: {order_id}, Status: {order['status']}")
+        logger.info("Futures stop order placed. Order ID: %s, Status: %s", order_id, order['status'])
 
         # Build record with all relevant fields
         record = {
@@ -123,16 +129,16 @@ def execute_futures_stop_order(binance_client: Client, symbol: str, side: str,
             'workingType': order.get('workingType', working_type),
             'closePosition': close_position,
             'reduceOnly': order.get('reduceOnly', not close_position),
-            'updateTime': datetime.fromtimestamp(order['updateTime'] / 1000).strftime('%Y-%m-%d %H:%M:%S')
+            'updateTime': datetime.fromtimestamp(order['updateTime'] / 1000).isoformat(sep=' ', timespec='seconds')
         }
 
         df = pd.DataFrame([record])
-        logger.info(f"Futures {order_type} order placed successfully")
+        logger.info("Futures %s order placed successfully", order_type)
 
         return df
 
     except Exception as e:
-        logger.error(f"Error placing futures stop order: {e}")
+        logger.error("Error placing futures stop order: %s", e)
         raise
 
 
@@ -279,7 +285,7 @@ def register_binance_futures_stop_order(local_mcp_instance, local_binance_client
             - Trailing stops follow the highest/lowest price since activation
             - CSV file saved for order tracking and audit
         """
-        logger.info(f"binance_futures_stop_order tool invoked: {order_type} {side} {symbol} by {requester}")
+        logger.info("binance_futures_stop_order tool invoked: %s %s %s by %s", order_type, side, symbol, requester)
 
         # Validate required parameters
         if not symbol:
@@ -309,12 +315,8 @@ def register_binance_futures_stop_order(local_mcp_instance, local_binance_client
             filename = f"futures_{order_type_short}_{symbol}_{side.lower()}_{str(uuid.uuid4())[:8]}.csv"
             filepath = csv_dir / filename
 
-            # Save to CSV file
-            df.to_csv(filepath, index=False)
-            logger.info(f"Saved futures stop order to {filename}")
-
-            # Return formatted response
-            result = format_csv_response(filepath, df)
+            # Save to CSV file in the background while the summary is built
+            csv_future, csv_size = submit_csv_write(filepath, df)
 
             # Add execution summary
             order_data = df.iloc[0]
@@ -381,6 +383,13 @@ Your stop order was triggered and filled immediately!
 Check your position with binance_manage_futures_positions().
 """
 
+            # Wait for the write so any I/O error surfaces before responding
+            csv_future.result()
+            logger.info("Saved futures stop order to %s", filename)
+
+            # Return formatted response
+            result = format_csv_response(filepath, df, file_size=csv_size)
+
             log_request(
                 requests_dir=requests_dir,
                 requester=requester,
@@ -403,8 +412,8 @@ Check your position with binance_manage_futures_positions().
             return result + summary
 
         except ValueError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             return f"Error: {str(e)}"
         except Exception as e:
-            logger.error(f"Error placing futures stop order: {e}")
+            logger.error("Error placing futures stop order: %s", e)
             return f"Error: {str(e)}\n\nCheck:\n- API credentials valid\n- Futures trading enabled\n- Correct symbol format (e.g., 'BTCUSDT')\n- Valid order_type: STOP_MARKET, TAKE_PROFIT_MARKET, TRAILING_STOP_MARKET"
@@ -1,17 +1,86 @@
 import logging
+import os
+import time
 from datetime import datetime
-from decimal import Decimal
-import uuid
-from mcp_service import format_csv_response
+from mcp_service import format_csv_response, unique_file_suffix
 from request_logger import log_request
+import numpy as np
 import pandas as pd
 from binance.client import Client
+from binance.exceptions import BinanceAPIException
 from typing import Optional
 from sentry_utils import with_sentry_tracing
 
 logger = logging.getLogger(__name__)
 
 
+# Short-lived cache so repeated calls within one agent turn skip the API
+# Format: {'last_call_time': timestamp, 'df': df}
+_account_cache = {'last_call_time': 0, 'df': None}
+
+# Binance reports empty balances with this canonical 8-decimal zero string
+ZERO_BALANCE = '0.00000000'
+BALANCE_DECIMALS = 8
+
+# Above this many held assets a single all-tickers request is cheaper than
+# per-symbol lookups, which run one after another
+MAX_PER_SYMBOL_PRICE_LOOKUPS = 3
+
+
+def invalidate_account_cache() -> None:
+    """Drop the cached account snapshot; call after placing or cancelling a spot order."""
+    _account_cache['df'] = None
+    _account_cache['last_call_time'] = 0
+
+
+def _fetch_usdt_price(binance_client: Client, asset: str) -> Optional[float]:
+    """Fetch the USDT price of a single asset, or None if no USDT pair exists."""
+    try:
+        ticker = binance_client.get_symbol_ticker(symbol=f"{asset}USDT")
+        return float(ticker['price'])
+    except BinanceAPIException:
+        return None
+
+
+def _build_price_map(binance_client: Client, assets: set) -> dict:
+    """
+    Build an asset -> USDT price lookup for the given assets.
+
+    Skips the ticker request entirely when only USDT is held, queries the
+    few held assets individually, and falls back to the full ticker dump for
+    larger portfolios. The lookups are sequential: python-binance's Client
+    keeps the last response on the instance, so concurrent requests on the
+    shared client can read each other's prices.
+    """
+    # USDT itself has a price of 1.0
+    price_map = {'USDT': 1.0}
+    needed_assets = assets - price_map.keys()
+
+    if not needed_assets:
+        logger.info("No non-USDT assets held, skipping price fetch")
+        return price_map
+
+    if len(needed_assets) <= MAX_PER_SYMBOL_PRICE_LOOKUPS:
+        logger.info("Fetching current prices for %s assets...", len(needed_assets))
+        for asset in needed_assets:
+            price = _fetch_usdt_price(binance_client, asset)
+            if price is not None:
+                price_map[asset] = price
+        return price_map
+
+    # Fetch all ticker prices for valuation
+    logger.info("Fetching current prices...")
+    for ticker in binance_client.get_all_tickers():
+        symbol = ticker['symbol']
+        # Extract prices for USDT pairs (e.g., BTCUSDT -> BTC)
+        if symbol.endswith('USDT'):
+            asset = symbol[:-4]  # Remove 'USDT' suffix
+            if asset in needed_assets:
+                price_map[asset] = float(ticker['price'])
+
+    return price_map
+
+
 @with_sentry_tracing("binance_get_account")
 def fetch_account(binance_client: Client) -> pd.DataFrame:
     """
@@ -34,91 +103,87 @@ def fetch_account(binance_client: Client) -> pd.DataFrame:
         Results are sorted by USDT value in descending order, with assets
         without USDT prices at the end.
     """
+    current_time = time.time()
+    cache_ttl = float(os.getenv('BINANCE_ACCOUNT_CACHE_TTL', '2'))
+
+    # Check if we can use cached data
+    if _account_cache['df'] is not None and current_time - _account_cache['last_call_time'] < cache_ttl:
+        logger.info("Using cached account data")
+        return _account_cache['df'].copy()
+
     logger.info("Fetching Binance account information")
 
-    records = []
     try:
         # Fetch account information from Binance API
         account_info = binance_client.get_account()
 
         # Log account status
         logger.info(
-            f"Account status - Can Trade: {account_info.get('canTrade')}, "
-            f"Can Withdraw: {account_info.get('canWithdraw')}, "
-            f"Can Deposit: {account_info.get('canDeposit')}"
+            "Account status - Can Trade: %s, Can Withdraw: %s, Can Deposit: %s",
+            account_info.get('canTrade'),
+            account_info.get('canWithdraw'),
+            account_info.get('canDeposit')
         )
 
-        # Fetch all ticker prices for valuation
-        logger.info("Fetching current prices...")
-        all_tickers = binance_client.get_all_tickers()
-
-        # Build price lookup dictionary for USDT pairs
-        price_map = {}
-        for ticker in all_tickers:
-            symbol = ticker['symbol']
-            # Extract prices for USDT pairs (e.g., BTCUSDT -> BTC)
-            if symbol.endswith('USDT'):
-                asset = symbol[:-4]  # Remove 'USDT' suffix
-                price_map[asset] = Decimal(ticker['price'])
-
-        # USDT itself has a price of 1.0
-        price_map['USDT'] = Decimal('1.0')
-
-        logger.info(f"Built price map for {len(price_map)} assets")
-
-        # Get all balances
-        balances = account_info.get('balances', [])
-
-        # Filter and process balances with non-zero amounts
-        for balance in balances:
-            free = Decimal(balance['free'])
-            locked = Decimal(balance['locked'])
-            total = free + locked
-
-            # Only include assets with non-zero balance
-            if total > 0:
-                asset = balance['asset']
-                # Get USDT price for this asset
-                price_usdt = price_map.get(asset)
-
-                # Calculate value in USDT
-                if price_usdt is not None:
-                    value_usdt = float(total * price_usdt)
-                else:
-                    value_usdt = None
-
-                records.append({
-                    'asset': asset,
-                    'free': float(free),
-                    'locked': float(locked),
-                    'total': float(total),
-                    'price_usdt': float(price_usdt) if price_usdt is not None else None,
-                    'value_usdt': value_usdt
-                })
-
-        logger.info(f"Found {len(records)} assets with non-zero balance")
+        # Keep only balances with non-zero amounts; the canonical zero string
+        # check skips parsing for the long tail of empty assets
+        balances = [
+            balance for balance in account_info.get('balances', [])
+            if not (balance['free'] == ZERO_BALANCE and balance['locked'] == ZERO_BALANCE)
+            and float(balance['free']) + float(balance['locked']) > 0
+        ]
+
+        # Build price lookup dictionary for the held assets
+        price_map = _build_price_map(binance_client, {balance['asset'] for balance in balances})
+        logger.info("Built price map for %s assets", len(price_map))
+
+        # Parse each numeric column in one pass into a pre-sized float64 array
+        n = len(balances)
+        assets = [balance['asset'] for balance in balances]
+        free = np.fromiter((balance['free'] for balance in balances), dtype=np.float64, count=n)
+        locked = np.fromiter((balance['locked'] for balance in balances), dtype=np.float64, count=n)
+        # Round derived columns to Binance's 8-decimal balance precision so
+        # float noise (e.g. 65.00012000000001) never reaches the CSV
+        total = np.round(free + locked, BALANCE_DECIMALS)
+        # USDT price per asset, NaN where no USDT pair exists
+        price_usdt = np.fromiter((price_map.get(asset, np.nan) for asset in assets), dtype=np.float64, count=n)
+        value_usdt = np.round(total * price_usdt, BALANCE_DECIMALS)
+
+        logger.info("Found %s assets with non-zero balance", len(assets))
 
     except Exception as e:
-        logger.error(f"Error fetching account data from Binance API: {e}")
+        logger.error("Error fetching account data from Binance API: %s", e)
         raise
 
     # Create DataFrame
-    df = pd.DataFrame(records)
+    df = pd.DataFrame({
+        'asset': assets,
+        'free': free,
+        'locked': locked,
+        'total': total,
+        'price_usdt': price_usdt,
+        'value_usdt': value_usdt
+    })
 
     # Sort by USDT value (descending), then by total amount
     # Put assets without USDT price at the end
     if not df.empty:
-        df['_sort_key'] = df['value_usdt'].fillna(-1)
-        df = df.sort_values('_sort_key', ascending=False).reset_index(drop=True)
-        df = df.drop(columns=['_sort_key'])
+        df = df.sort_values('value_usdt', ascending=False, na_position='last').reset_index(drop=True)
 
-    logger.info(f"Successfully fetched account data for {len(df)} assets")
+    logger.info("Successfully fetched account data for %s assets", len(df))
+
+    # Update cache
+    _account_cache['last_call_time'] = current_time
+    _account_cache['df'] = df.copy()
 
     return df
 
 
 def register_binance_get_account(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
     """Register the binance_get_account tool"""
+    # Joined once here so each call builds its output path with plain string concatenation
+    csv_dir_prefix = os.fspath(csv_dir) + os.sep
+
     @local_mcp_instance.tool()
     def binance_get_account(requester: str) -> str:
         """
@@ -170,7 +235,7 @@ def register_binance_get_account(local_mcp_instance, local_binance_client, csv_d
             Results are sorted by USDT value in descending order, showing your
             most valuable holdings first. Assets without USDT pricing appear at the end.
         """
-        logger.info(f"binance_get_account tool invoked by {requester}")
+        logger.info("binance_get_account tool invoked by %s", requester)
 
         # Call fetch_account function
         df = fetch_account(binance_client=local_binance_client)
@@ -179,15 +244,17 @@ def register_binance_get_account(local_mcp_instance, local_binance_client, csv_d
             return "No assets found with non-zero balance in your Binance account."
 
         # Generate filename with unique identifier
-        filename = f"account_{str(uuid.uuid4())[:8]}.csv"
-        filepath = csv_dir / filename
+        filename = "account_" + unique_file_suffix() + ".csv"
+        filepath = csv_dir_prefix + filename
 
-        # Save to CSV file
-        df.to_csv(filepath, index=False)
-        logger.info(f"Saved account data to {filename} ({len(df)} assets)")
+        # Save to CSV file, keeping the byte count so the response needs no stat
+        csv_bytes = df.to_csv(index=False).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(csv_bytes)
+        logger.info("Saved account data to %s (%s assets)", filename, len(df))
 
         # Return formatted response
-        result = format_csv_response(filepath, df)
+        result = format_csv_response(filepath, df, file_size=len(csv_bytes))
 
         # Log the request for audit trail
         log_request(
@@ -1,7 +1,7 @@
 import logging
-from decimal import Decimal
-import uuid
-from mcp_service import format_csv_response
+import os
+import time
+from mcp_service import format_csv_response_cached, write_csv_rows_deduplicated
 from request_logger import log_request
 import pandas as pd
 from binance.client import Client
@@ -9,28 +9,38 @@ from sentry_utils import with_sentry_tracing
 
 logger = logging.getLogger(__name__)
 
+# Short-lived per-symbol cache so repeated calls skip the API
+# (the average itself spans a 5-minute window)
+# Format: {symbol: (timestamp, record)}
+_avg_price_cache = {}
+
 
 @with_sentry_tracing("binance_get_avg_price")
-def fetch_avg_price(binance_client: Client, symbol: str = 'BTCUSDT') -> pd.DataFrame:
+def fetch_avg_price_record(binance_client: Client, symbol: str = 'BTCUSDT') -> dict:
     """
-    Fetch average price for a symbol and return as DataFrame.
+    Fetch average price for a symbol and return it as a plain record dict.
+
+    This is the pandas-free path used by the MCP tool; fetch_avg_price wraps
+    it for callers that want a DataFrame.
 
     Args:
         binance_client: Initialized Binance Client
         symbol: Trading pair symbol (e.g., 'BTCUSDT', 'ETHUSDT')
 
     Returns:
-        DataFrame with average price containing columns:
-        - symbol: Trading pair symbol
-        - avg_price: Volume-weighted average price
-        - time_window_mins: Time window in minutes for the average (typically 5)
-
-    Note:
-        The average price is calculated as a volume-weighted average over
-        a specific time period (typically 5 minutes). This provides a smoothed
-        price that filters out short-term volatility.
+        Dict with keys symbol, avg_price and time_window_mins
+        (see fetch_avg_price for their meaning)
     """
-    logger.info(f"Fetching average price for {symbol}")
+    current_time = time.time()
+    cache_ttl = float(os.getenv('BINANCE_AVG_PRICE_CACHE_TTL', '30'))
+
+    # Check if we can use cached data
+    cached = _avg_price_cache.get(symbol)
+    if cached is not None and current_time - cached[0] < cache_ttl:
+        logger.info("Using cached average price for %s", symbol)
+        return dict(cached[1])
+
+    logger.info("Fetching average price for %s", symbol)
 
     try:
         # Fetch average price from Binance API
@@ -39,20 +49,45 @@ def fetch_avg_price(binance_client: Client, symbol: str = 'BTCUSDT') -> pd.DataF
         # Build record
         record = {
             'symbol': symbol,
-            'avg_price': float(Decimal(avg_price_data['price'])),
+            'avg_price': float(avg_price_data['price']),
             'time_window_mins': int(avg_price_data['mins'])
         }
 
-        logger.info(f"Successfully fetched average price for {symbol}: {record['avg_price']} (over {record['time_window_mins']} minutes)")
+        logger.info("Successfully fetched average price for %s: %s (over %s minutes)", symbol, record['avg_price'], record['time_window_mins'])
 
     except Exception as e:
-        logger.error(f"Error fetching average price from Binance API: {e}")
+        logger.error("Error fetching average price from Binance API: %s", e)
         raise
 
-    # Create DataFrame with single row
-    df = pd.DataFrame([record])
+    # Update cache
+    _avg_price_cache[symbol] = (current_time, dict(record))
 
-    return df
+    return record
+
+
+def fetch_avg_price(binance_client: Client, symbol: str = 'BTCUSDT') -> pd.DataFrame:
+    """
+    Fetch average price for a symbol and return as DataFrame.
+
+    Args:
+        binance_client: Initialized Binance Client
+        symbol: Trading pair symbol (e.g., 'BTCUSDT', 'ETHUSDT')
+
+    Returns:
+        DataFrame with average price containing columns:
+        - symbol: Trading pair symbol
+        - avg_price: Volume-weighted average price
+        - time_window_mins: Time window in minutes for the average (typically 5)
+
+    Note:
+        The average price is calculated as a volume-weighted average over
+        a specific time period (typically 5 minutes). This provides a smoothed
+        price that filters out short-term volatility.
+    """
+    record = fetch_avg_price_record(binance_client, symbol)
+
+    # Create DataFrame with single row, column-wise to skip per-row dtype inference
+    return pd.DataFrame({column: [value] for column, value in record.items()})
 
 
 def register_binance_get_avg_price(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
@@ -144,21 +179,20 @@ def register_binance_get_avg_price(local_mcp_instance, local_binance_client, csv
             may vary. Check the time_window_mins field for the actual period.
             Data is READ-ONLY and does not execute any trades.
         """
-        logger.info(f"binance_get_avg_price tool invoked by {requester} for symbol: {symbol}")
+        logger.info("binance_get_avg_price tool invoked by %s for symbol: %s", requester, symbol)
 
-        # Call fetch_avg_price function
-        df = fetch_avg_price(binance_client=local_binance_client, symbol=symbol)
+        # Fetch the single record; no DataFrame is needed for one row
+        record = fetch_avg_price_record(binance_client=local_binance_client, symbol=symbol)
 
-        # Generate filename with unique identifier
-        filename = f"avg_price_{symbol}_{str(uuid.uuid4())[:8]}.csv"
-        filepath = csv_dir / filename
-
-        # Save to CSV file
-        df.to_csv(filepath, index=False)
-        logger.info(f"Saved average price data to {filename} for {symbol}")
+        # Save the single row directly under a content-addressed name, so an
+        # identical repeat response reuses the existing file
+        filepath, _ = write_csv_rows_deduplicated(
+            csv_dir, f"avg_price_{symbol}", record.keys(), [record.values()]
+        )
+        logger.info("Saved average price data to %s for %s", filepath.name, symbol)
 
         # Return formatted response
-        result = format_csv_response(filepath, df)
+        result = format_csv_response_cached(filepath, [record])
 
         # Log the request for audit trail
         log_request(
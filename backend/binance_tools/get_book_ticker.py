@@ -1,7 +1,7 @@
 import logging
-from decimal import Decimal
-import uuid
-from mcp_service import format_csv_response
+import os
+import time
+from mcp_service import format_csv_response_cached, write_csv_rows_deduplicated
 from request_logger import log_request
 import pandas as pd
 from binance.client import Client
@@ -9,8 +9,97 @@ from sentry_utils import with_sentry_tracing
 
 logger = logging.getLogger(__name__)
 
+# Short-lived per-symbol cache so repeated calls skip the API
+# (top-of-book moves fast, so the window is sub-second)
+# Format: {symbol: (timestamp, record)}
+_book_ticker_cache = {}
+
+
+def decimal_places(value: str) -> int:
+    """Count the significant decimal places of a Binance numeric string ('0.01000000' -> 2)."""
+    return len(value.partition('.')[2].rstrip('0'))
+
+
+def build_book_ticker_record(ticker: dict) -> dict:
+    """Convert a raw Binance book ticker entry into a CSV record with derived metrics."""
+    # Extract and convert data
+    bid_price = float(ticker['bidPrice'])
+    bid_qty = float(ticker['bidQty'])
+    ask_price = float(ticker['askPrice'])
+    ask_qty = float(ticker['askQty'])
+
+    # Derived values are exact at the precision of their inputs, so rounding
+    # to it strips the float noise (e.g. a 0.00999999999476131 spread)
+    bid_price_dp = decimal_places(ticker['bidPrice'])
+    ask_price_dp = decimal_places(ticker['askPrice'])
+    price_dp = max(bid_price_dp, ask_price_dp)
+
+    # Calculate derived metrics
+    spread = round(ask_price - bid_price, price_dp)
+    spread_percent = round((spread / bid_price) * 100, 12) if bid_price > 0 else 0.0
+    mid_price = round((bid_price + ask_price) / 2, price_dp + 1)
+    bid_value = round(bid_price * bid_qty, bid_price_dp + decimal_places(ticker['bidQty']))
+    ask_value = round(ask_price * ask_qty, ask_price_dp + decimal_places(ticker['askQty']))
+
+    return {
+        'symbol': ticker['symbol'],
+        'bid_price': bid_price,
+        'bid_qty': bid_qty,
+        'ask_price': ask_price,
+        'ask_qty': ask_qty,
+        'spread': spread,
+        'spread_percent': spread_percent,
+        'mid_price': mid_price,
+        'bid_value': bid_value,
+        'ask_value': ask_value
+    }
+
 
 @with_sentry_tracing("binance_get_book_ticker")
+def fetch_book_ticker_record(binance_client: Client, symbol: str = 'BTCUSDT') -> dict:
+    """
+    Fetch order book ticker (best bid/ask) for a symbol and return it as a plain record dict.
+
+    This is the pandas-free path used by the MCP tool; fetch_book_ticker wraps
+    it for callers that want a DataFrame.
+
+    Args:
+        binance_client: Initialized Binance Client
+        symbol: Trading pair symbol (e.g., 'BTCUSDT', 'ETHUSDT')
+
+    Returns:
+        Dict with the keys built by build_book_ticker_record
+        (see fetch_book_ticker for their meaning)
+    """
+    current_time = time.time()
+    cache_ttl = float(os.getenv('BINANCE_BOOK_TICKER_CACHE_TTL', '0.5'))
+
+    # Check if we can use cached data
+    cached = _book_ticker_cache.get(symbol)
+    if cached is not None and current_time - cached[0] < cache_ttl:
+        logger.info("Using cached book ticker for %s", symbol)
+        return dict(cached[1])
+
+    logger.info("Fetching order book ticker for %s", symbol)
+
+    try:
+        # Fetch order book ticker from Binance API
+        ticker = binance_client.get_orderbook_ticker(symbol=symbol)
+
+        record = build_book_ticker_record(ticker)
+
+        logger.info("Successfully fetched book ticker for %s", symbol)
+
+    except Exception as e:
+        logger.error("Error fetching book ticker from Binance API: %s", e)
+        raise
+
+    # Update cache
+    _book_ticker_cache[symbol] = (current_time, dict(record))
+
+    return record
+
+
 def fetch_book_ticker(binance_client: Client, symbol: str = 'BTCUSDT') -> pd.DataFrame:
     """
     Fetch order book ticker (best bid/ask) for a symbol and return as DataFrame.
@@ -36,49 +125,10 @@ def fetch_book_ticker(binance_client: Client, symbol: str = 'BTCUSDT') -> pd.Dat
         This is a lightweight alternative to fetching the full order book
         when you only need the best bid and ask prices with quantities.
     """
-    logger.info(f"Fetching order book ticker for {symbol}")
-
-    try:
-        # Fetch order book ticker from Binance API
-        ticker = binance_client.get_orderbook_ticker(symbol=symbol)
-
-        # Extract and convert data
-        bid_price = Decimal(ticker['bidPrice'])
-        bid_qty = Decimal(ticker['bidQty'])
-        ask_price = Decimal(ticker['askPrice'])
-        ask_qty = Decimal(ticker['askQty'])
-
-        # Calculate derived metrics
-        spread = ask_price - bid_price
-        spread_percent = float((spread / bid_price) * 100) if bid_price > 0 else 0.0
-        mid_price = (bid_price + ask_price) / 2
-        bid_value = bid_price * bid_qty
-        ask_value = ask_price * ask_qty
-
-        # Build record
-        record = {
-            'symbol': ticker['symbol'],
-            'bid_price': float(bid_price),
-            'bid_qty': float(bid_qty),
-            'ask_price': float(ask_price),
-            'ask_qty': float(ask_qty),
-            'spread': float(spread),
-            'spread_percent': spread_percent,
-            'mid_price': float(mid_price),
-            'bid_value': float(bid_value),
-            'ask_value': float(ask_value)
-        }
-
-        logger.info(f"Successfully fetched book ticker for {symbol}")
+    record = fetch_book_ticker_record(binance_client, symbol)
 
-    except Exception as e:
-        logger.error(f"Error fetching book ticker from Binance API: {e}")
-        raise
-
-    # Create DataFrame with single row
-    df = pd.DataFrame([record])
-
-    return df
+    # Create DataFrame with single row, column-wise to skip per-row dtype inference
+    return pd.DataFrame({column: [value] for column, value in record.items()})
 
 
 def register_binance_get_book_ticker(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
@@ -170,21 +220,20 @@ def register_binance_get_book_ticker(local_mcp_instance, local_binance_client, c
             with multiple price levels, use binance_get_orderbook.
             Data is READ-ONLY and does not execute any trades.
         """
-        logger.info(f"binance_get_book_ticker tool invoked by {requester} for symbol: {symbol}")
+        logger.info("binance_get_book_ticker tool invoked by %s for symbol: %s", requester, symbol)
 
-        # Call fetch_book_ticker function
-        df = fetch_book_ticker(binance_client=local_binance_client, symbol=symbol)
+        # Fetch the single record; no DataFrame is needed for one row
+        record = fetch_book_ticker_record(binance_client=local_binance_client, symbol=symbol)
 
-        # Generate filename with unique identifier
-        filename = f"book_ticker_{symbol}_{str(uuid.uuid4())[:8]}.csv"
-        filepath = csv_dir / filename
-
-        # Save to CSV file
-        df.to_csv(filepath, index=False)
-        logger.info(f"Saved book ticker data to {filename} for {symbol}")
+        # Save the single row directly under a content-addressed name, so an
+        # identical repeat response reuses the existing file
+        filepath, _ = write_csv_rows_deduplicated(
+            csv_dir, f"book_ticker_{symbol}", record.keys(), [record.values()]
+        )
+        logger.info("Saved book ticker data to %s for %s", filepath.name, symbol)
 
         # Return formatted response
-        result = format_csv_response(filepath, df)
+        result = format_csv_response_cached(filepath, [record])
 
         # Log the request for audit trail
         log_request(
@@ -0,0 +1,161 @@
+import logging
+from itertools import repeat
+from mcp_service import format_csv_response, unique_file_suffix
+from request_logger import log_request
+import numpy as np
+import pandas as pd
+from binance.client import Client
+from binance_tools.get_book_ticker import decimal_places
+from typing import List, Optional
+from sentry_utils import with_sentry_tracing
+
+logger = logging.getLogger(__name__)
+
+
+def _round_each(values: np.ndarray, decimals) -> np.ndarray:
+    """Round each value to its own decimal places with round(), as build_book_ticker_record does."""
+    return np.array([round(value, places) for value, places in zip(values.tolist(), decimals)], dtype=np.float64)
+
+
+@with_sentry_tracing("binance_get_book_tickers")
+def fetch_book_tickers(binance_client: Client, symbols: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Fetch order book tickers (best bid/ask) for many symbols in one request.
+
+    Args:
+        binance_client: Initialized Binance Client
+        symbols: Trading pair symbols to keep (e.g., ['BTCUSDT', 'ETHUSDT']).
+            None returns every symbol on the exchange.
+
+    Returns:
+        DataFrame with one row per symbol and the same columns as
+        fetch_book_ticker (bid/ask prices and quantities, spread,
+        spread_percent, mid_price, bid_value, ask_value).
+
+    Note:
+        A single call to the bookTicker endpoint without a symbol returns the
+        whole exchange, so N symbols cost one round-trip instead of N.
+        Requested symbols that do not exist are silently absent from the result.
+    """
+    logger.info("Fetching order book tickers for %s symbols", len(symbols) if symbols else 'all')
+
+    try:
+        # One request returns the best bid/ask for every symbol
+        tickers = binance_client.get_orderbook_ticker()
+
+        if symbols:
+            wanted = {symbol.upper() for symbol in symbols}
+            tickers = [ticker for ticker in tickers if ticker['symbol'] in wanted]
+
+        logger.info("Successfully fetched %s book tickers", len(tickers))
+
+    except Exception as e:
+        logger.error("Error fetching book tickers from Binance API: %s", e)
+        raise
+
+    # Parse each field once into a float64 column
+    n = len(tickers)
+    bid_price = np.fromiter((ticker['bidPrice'] for ticker in tickers), dtype=np.float64, count=n)
+    bid_qty = np.fromiter((ticker['bidQty'] for ticker in tickers), dtype=np.float64, count=n)
+    ask_price = np.fromiter((ticker['askPrice'] for ticker in tickers), dtype=np.float64, count=n)
+    ask_qty = np.fromiter((ticker['askQty'] for ticker in tickers), dtype=np.float64, count=n)
+
+    # Derived values are exact at the precision of their inputs, so each is
+    # rounded to it, giving the same values as binance_get_book_ticker
+    bid_price_dp = [decimal_places(ticker['bidPrice']) for ticker in tickers]
+    ask_price_dp = [decimal_places(ticker['askPrice']) for ticker in tickers]
+    price_dp = [max(bid_dp, ask_dp) for bid_dp, ask_dp in zip(bid_price_dp, ask_price_dp)]
+    bid_value_dp = [dp + decimal_places(ticker['bidQty']) for dp, ticker in zip(bid_price_dp, tickers)]
+    ask_value_dp = [dp + decimal_places(ticker['askQty']) for dp, ticker in zip(ask_price_dp, tickers)]
+
+    # Calculate derived metrics over the whole batch
+    spread = _round_each(ask_price - bid_price, price_dp)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        spread_percent = _round_each(np.where(bid_price > 0, spread / bid_price * 100, 0.0), repeat(12))
+
+    df = pd.DataFrame({
+        'symbol': [ticker['symbol'] for ticker in tickers],
+        'bid_price': bid_price,
+        'bid_qty': bid_qty,
+        'ask_price': ask_price,
+        'ask_qty': ask_qty,
+        'spread': spread,
+        'spread_percent': spread_percent,
+        'mid_price': _round_each((bid_price + ask_price) * 0.5, [dp + 1 for dp in price_dp]),
+        'bid_value': _round_each(bid_price * bid_qty, bid_value_dp),
+        'ask_value': _round_each(ask_price * ask_qty, ask_value_dp)
+    })
+
+    return df
+
+
+def register_binance_get_book_tickers(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
+    """Register the binance_get_book_tickers tool"""
+    @local_mcp_instance.tool()
+    def binance_get_book_tickers(requester: str, symbols: Optional[List[str]] = None) -> str:
+        """
+        Fetch best bid/ask prices for several symbols in a single API call and save to CSV.
+
+        Batch version of binance_get_book_ticker: instead of one request per symbol,
+        the whole exchange's book tickers are fetched once and filtered to the
+        requested symbols. Use this when comparing spreads or liquidity across a
+        portfolio or watchlist.
+
+        Parameters:
+            requester (str): Identifier of who is calling this tool (e.g., 'trading-agent', 'user-alex').
+                Used for request logging and audit purposes.
+            symbols (list of str, optional): Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT']).
+                Omit to get every symbol on the exchange.
+
+        Returns:
+            str: Formatted response with CSV file info, schema, sample data, and Python snippet to load the file.
+
+        CSV Output Columns:
+            - symbol (string): Trading pair symbol
+            - bid_price (float): Best bid price
+            - bid_qty (float): Quantity available at best bid
+            - ask_price (float): Best ask price
+            - ask_qty (float): Quantity available at best ask
+            - spread (float): Absolute spread (ask_price - bid_price)
+            - spread_percent (float): Spread as percentage of bid price
+            - mid_price (float): Mid-market price ((bid + ask) / 2)
+            - bid_value (float): Total value at best bid (bid_price * bid_qty)
+            - ask_value (float): Total value at best ask (ask_price * ask_qty)
+
+        Example usage:
+            binance_get_book_tickers(symbols=['BTCUSDT', 'ETHUSDT', 'BNBUSDT'])
+            binance_get_book_tickers()
+
+        Note:
+            Symbols that do not exist on Binance are skipped.
+            Data is READ-ONLY and does not execute any trades.
+        """
+        logger.info("binance_get_book_tickers tool invoked by %s for symbols: %s", requester, symbols)
+
+        # Call fetch_book_tickers function
+        df = fetch_book_tickers(binance_client=local_binance_client, symbols=symbols)
+
+        if df.empty:
+            return f"No book tickers found for symbols: {symbols}"
+
+        # Generate filename with unique identifier
+        filename = f"book_tickers_{unique_file_suffix()}.csv"
+        filepath = csv_dir / filename
+
+        # Save to CSV file
+        df.to_csv(filepath, index=False)
+        logger.info("Saved book tickers to %s (%s symbols)", filename, len(df))
+
+        # Return formatted response
+        result = format_csv_response(filepath, df)
+
+        # Log the request for audit trail
+        log_request(
+            requests_dir=requests_dir,
+            requester=requester,
+            tool_name="binance_get_book_tickers",
+            input_params={"symbols": symbols},
+            output_result=result
+        )
+
+        return result
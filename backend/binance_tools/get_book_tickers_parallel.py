@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from mcp_service import format_csv_response, unique_file_suffix
+from request_logger import log_request
+import pandas as pd
+from binance.client import Client
+from binance_tools.get_book_tickers import fetch_book_tickers
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+
+async def fetch_book_tickers_parallel(binance_client: Client, symbols: List[str]) -> pd.DataFrame:
+    """
+    Fetch order book tickers (best bid/ask) for several symbols without blocking the event loop.
+
+    Args:
+        binance_client: Initialized Binance Client
+        symbols: Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+
+    Returns:
+        DataFrame with one row per symbol found, in the caller's order, and
+        the same columns as fetch_book_ticker
+
+    Note:
+        The symbols are served from one bulk bookTicker request on a worker
+        thread. Concurrent per-symbol requests are not used: python-binance's
+        Client keeps the last response on the instance, so requests running
+        at the same time on the shared client can read each other's data.
+        Symbols that do not exist are left out of the result.
+    """
+    # Deduplicate while keeping the caller's order
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    logger.info("Fetching order book tickers for %s symbols", len(symbols))
+    if not symbols:
+        # fetch_book_tickers treats an empty list as "every symbol"
+        return pd.DataFrame()
+
+    df = await asyncio.to_thread(fetch_book_tickers, binance_client, symbols)
+
+    # The bulk response comes in exchange order; return the caller's order
+    position = {symbol: index for index, symbol in enumerate(symbols)}
+    return df.sort_values('symbol', key=lambda column: column.map(position), ignore_index=True)
+
+
+def register_binance_get_book_tickers_parallel(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
+    """Register the binance_get_book_tickers_parallel tool"""
+    @local_mcp_instance.tool()
+    async def binance_get_book_tickers_parallel(requester: str, symbols: List[str]) -> str:
+        """
+        Fetch best bid/ask prices for several symbols and save to CSV, in the order requested.
+
+        Same values as calling binance_get_book_ticker once per symbol, but all
+        symbols are served from a single bulk request, so the total wait is one
+        round-trip. The request runs on a worker thread, so the server's event
+        loop is not blocked while it is in flight.
+
+        Parameters:
+            requester (str): Identifier of who is calling this tool (e.g., 'trading-agent', 'user-alex').
+                Used for request logging and audit purposes.
+            symbols (list of str): Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT', 'SOLUSDT'])
+
+        Returns:
+            str: Formatted response with CSV file info, schema, sample data, and Python snippet to load the file.
+
+        CSV Output Columns:
+            - symbol (string): Trading pair symbol
+            - bid_price (float): Best bid price
+            - bid_qty (float): Quantity available at best bid
+            - ask_price (float): Best ask price
+            - ask_qty (float): Quantity available at best ask
+            - spread (float): Absolute spread (ask_price - bid_price)
+            - spread_percent (float): Spread as percentage of bid price
+            - mid_price (float): Mid-market price ((bid + ask) / 2)
+            - bid_value (float): Total value at best bid (bid_price * bid_qty)
+            - ask_value (float): Total value at best ask (ask_price * ask_qty)
+
+        Example usage:
+            binance_get_book_tickers_parallel(symbols=['BTCUSDT', 'ETHUSDT', 'BNBUSDT'])
+
+        Note:
+            Unknown symbols are skipped.
+            Data is READ-ONLY and does not execute any trades.
+        """
+        logger.info("binance_get_book_tickers_parallel tool invoked by %s for symbols: %s", requester, symbols)
+
+        # Call fetch_book_tickers_parallel function
+        df = await fetch_book_tickers_parallel(binance_client=local_binance_client, symbols=symbols)
+
+        if df.empty:
+            return f"No book tickers found for symbols: {symbols}"
+
+        # Generate filename with unique identifier
+        filename = f"book_tickers_parallel_{unique_file_suffix()}.csv"
+        filepath = csv_dir / filename
+
+        # Save to CSV file
+        df.to_csv(filepath, index=False)
+        logger.info("Saved book tickers to %s (%s symbols)", filename, len(df))
+
+        # Return formatted response
+        result = format_csv_response(filepath, df)
+
+        # Log the request for audit trail
+        log_request(
+            requests_dir=requests_dir,
+            requester=requester,
+            tool_name="binance_get_book_tickers_parallel",
+            input_params={"symbols": symbols},
+            output_result=result
+        )
+
+        return result
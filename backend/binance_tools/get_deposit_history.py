@@ -1,18 +1,172 @@
 import logging
-from datetime import datetime
-from decimal import Decimal
-import uuid
-from mcp_service import format_csv_response
+from mcp_service import (
+    format_csv_response, format_ms_timestamp, format_ms_timestamps, submit_csv_write,
+    unique_file_suffix, write_csv_rows
+)
 from request_logger import log_request
+import numpy as np
 import pandas as pd
 from binance.client import Client
-from typing import Optional
+from typing import List, Optional
 from sentry_utils import with_sentry_tracing
 
 logger = logging.getLogger(__name__)
 
+# Status code mapping
+DEPOSIT_STATUS_TEXT = {
+    0: "Pending",
+    1: "Success",
+    2: "Rejected",
+    6: "Credited (Cannot Withdraw)",
+    7: "Wrong Deposit",
+    8: "Waiting User Confirm"
+}
+
+# Status text indexed by status code; '' marks codes without a known text
+_STATUS_TEXT_LUT = tuple(DEPOSIT_STATUS_TEXT.get(code, '') for code in range(max(DEPOSIT_STATUS_TEXT) + 1))
+
+# Up to this many deposits are written with the csv module instead of pandas
+SMALL_RESULT_MAX_ROWS = 16
+
+# Fields read from each API deposit record, in output order; the derived
+# status_text and *_readable columns are inserted after their source columns
+DEPOSIT_API_COLUMNS = [
+    'id', 'amount', 'coin', 'network', 'status', 'address', 'addressTag', 'txId',
+    'insertTime', 'completeTime', 'transferType', 'confirmTimes', 'unlockConfirm', 'walletType'
+]
+
 
 @with_sentry_tracing("binance_get_deposit_history")
+def fetch_deposit_records(
+    binance_client: Client,
+    coin: Optional[str] = None,
+    status: Optional[int] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    limit: Optional[int] = None
+) -> List[dict]:
+    """
+    Fetch raw Binance crypto deposit records (the API's list of dicts).
+
+    Takes the same filters as fetch_deposit_history; use that function to get
+    the processed DataFrame.
+    """
+    logger.info(f"Fetching deposit history - coin: {coin}, status: {status}, limit: {limit}")
+
+    # Build parameters dict
+    params = {}
+    if coin:
+        params['coin'] = coin
+    if status is not None:
+        params['status'] = status
+    if start_time:
+        params['startTime'] = start_time
+    if end_time:
+        params['endTime'] = end_time
+    if limit:
+        params['limit'] = limit
+
+    try:
+        # Fetch deposit history from Binance API
+        deposits = binance_client.get_deposit_history(**params)
+        logger.info(f"Received {len(deposits)} deposit records")
+        return deposits
+
+    except Exception as e:
+        logger.error(f"Error fetching deposit history from Binance API: {e}")
+        raise
+
+
+def _deposit_status_text(status: pd.Series, deposits: List[dict]) -> np.ndarray:
+    """Map a status code column to its text with one lookup-table gather."""
+    # Missing codes (NaN when a record has no status) become -1, outside the table
+    numeric = status.to_numpy(dtype=np.float64, na_value=np.nan)
+    codes = np.where(np.isnan(numeric), -1, numeric).astype(np.int64)
+
+    status_text = np.full(len(codes), '', dtype=object)
+    in_range = (codes >= 0) & (codes < len(_STATUS_TEXT_LUT))
+    status_text[in_range] = np.array(_STATUS_TEXT_LUT, dtype=object)[codes[in_range]]
+
+    # Codes without a table entry (rare) keep the original API value in the
+    # label, as build_deposit_history_rows does ("Unknown (None)", not "nan")
+    for i in np.flatnonzero(status_text == ''):
+        status_text[i] = f"Unknown ({deposits[i].get('status')})"
+    return status_text
+
+
+def build_deposit_history_df(deposits: List[dict]) -> pd.DataFrame:
+    """Build the deposit history DataFrame (see fetch_deposit_history) from raw API records."""
+    # Build the DataFrame in one pass from the API records; fields missing
+    # from a record come out as NaN and are filled below
+    df = pd.DataFrame.from_records(deposits, columns=DEPOSIT_API_COLUMNS)
+
+    if not df.empty:
+        # Fill optional fields that some records omit
+        df['addressTag'] = df['addressTag'].fillna('')
+        df['confirmTimes'] = df['confirmTimes'].fillna('')
+        df['unlockConfirm'] = df['unlockConfirm'].fillna(0).astype('int64')
+        df['walletType'] = df['walletType'].fillna(0).astype('int64')
+
+        df['amount'] = pd.to_numeric(df['amount'].fillna(0)).astype('float64')
+
+        # Few distinct values: store as categoricals (small integer codes per row)
+        df['coin'] = df['coin'].astype('category')
+        df['network'] = df['network'].astype('category')
+
+        # Insert derived columns next to their sources (no reindex copy)
+        status_text = _deposit_status_text(df['status'], deposits)
+        df.insert(df.columns.get_loc('status') + 1, 'status_text', status_text)
+
+        # Convert timestamps to readable format
+        for column in ('insertTime', 'completeTime'):
+            df.insert(df.columns.get_loc(column) + 1, f'{column}_readable', format_ms_timestamps(df[column], blank_zero=True))
+
+        # Sort by insertTime descending (newest first): stable-argsort the negated
+        # int64 keys so ties keep input order (missing times sort last, as 0),
+        # take the rows, and give the result a fresh RangeIndex in place
+        order = np.argsort(-df['insertTime'].fillna(0).astype('int64').to_numpy(), kind='stable')
+        df = df.take(order)
+        df.index = pd.RangeIndex(len(df))
+
+    logger.info(f"Successfully processed {len(df)} deposit records")
+
+    return df
+
+
+def build_deposit_history_rows(deposits: List[dict]) -> List[dict]:
+    """
+    Build the deposit history rows as plain dicts, without pandas.
+
+    Same columns and values as build_deposit_history_df; used for small
+    results where DataFrame setup costs more than the rows themselves.
+    """
+    rows = []
+    for deposit in sorted(deposits, key=lambda d: d.get('insertTime') or 0, reverse=True):
+        insert_time = deposit.get('insertTime')
+        complete_time = deposit.get('completeTime')
+        deposit_status = deposit.get('status')
+        rows.append({
+            'id': deposit.get('id'),
+            'amount': float(deposit.get('amount', 0)),
+            'coin': deposit.get('coin'),
+            'network': deposit.get('network'),
+            'status': deposit_status,
+            'status_text': DEPOSIT_STATUS_TEXT.get(deposit_status, f"Unknown ({deposit_status})"),
+            'address': deposit.get('address'),
+            'addressTag': deposit.get('addressTag', ''),
+            'txId': deposit.get('txId'),
+            'insertTime': insert_time,
+            'insertTime_readable': format_ms_timestamp(insert_time) if insert_time else None,
+            'completeTime': complete_time,
+            'completeTime_readable': format_ms_timestamp(complete_time) if complete_time else None,
+            'transferType': deposit.get('transferType'),
+            'confirmTimes': deposit.get('confirmTimes', ''),
+            'unlockConfirm': deposit.get('unlockConfirm', 0),
+            'walletType': deposit.get('walletType', 0)
+        })
+    return rows
+
+
 def fetch_deposit_history(
     binance_client: Client,
     coin: Optional[str] = None,
@@ -56,80 +210,15 @@ def fetch_deposit_history(
         - Time span between start_time and end_time cannot exceed 90 days
         - Defaults to last 90 days if no time parameters provided
     """
-    logger.info(f"Fetching deposit history - coin: {coin}, status: {status}, limit: {limit}")
-
-    # Build parameters dict
-    params = {}
-    if coin:
-        params['coin'] = coin
-    if status is not None:
-        params['status'] = status
-    if start_time:
-        params['startTime'] = start_time
-    if end_time:
-        params['endTime'] = end_time
-    if limit:
-        params['limit'] = limit
-
-    try:
-        # Fetch deposit history from Binance API
-        deposits = binance_client.get_deposit_history(**params)
-        logger.info(f"Received {len(deposits)} deposit records")
-
-        # Status code mapping
-        status_map = {
-            0: "Pending",
-            1: "Success",
-            2: "Rejected",
-            6: "Credited (Cannot Withdraw)",
-            7: "Wrong Deposit",
-            8: "Waiting User Confirm"
-        }
-
-        # Process each deposit record
-        records = []
-        for deposit in deposits:
-            # Convert timestamps to readable format
-            insert_time = deposit.get('insertTime')
-            complete_time = deposit.get('completeTime')
-
-            insert_readable = datetime.fromtimestamp(insert_time / 1000).strftime('%Y-%m-%d %H:%M:%S') if insert_time else None
-            complete_readable = datetime.fromtimestamp(complete_time / 1000).strftime('%Y-%m-%d %H:%M:%S') if complete_time else None
-
-            records.append({
-                'id': deposit.get('id'),
-                'amount': float(deposit.get('amount', 0)),
-                'coin': deposit.get('coin'),
-                'network': deposit.get('network'),
-                'status': deposit.get('status'),
-                'status_text': status_map.get(deposit.get('status'), f"Unknown ({deposit.get('status')})"),
-                'address': deposit.get('address'),
-                'addressTag': deposit.get('addressTag', ''),
-                'txId': deposit.get('txId'),
-                'insertTime': insert_time,
-                'insertTime_readable': insert_readable,
-                'completeTime': complete_time,
-                'completeTime_readable': complete_readable,
-                'transferType': deposit.get('transferType'),
-                'confirmTimes': deposit.get('confirmTimes', ''),
-                'unlockConfirm': deposit.get('unlockConfirm', 0),
-                'walletType': deposit.get('walletType', 0)
-            })
-
-        # Create DataFrame
-        df = pd.DataFrame(records)
-
-        # Sort by insertTime descending (newest first)
-        if not df.empty and 'insertTime' in df.columns:
-            df = df.sort_values('insertTime', ascending=False).reset_index(drop=True)
-
-        logger.info(f"Successfully processed {len(df)} deposit records")
-
-        return df
-
-    except Exception as e:
-        logger.error(f"Error fetching deposit history from Binance API: {e}")
-        raise
+    deposits = fetch_deposit_records(
+        binance_client,
+        coin=coin,
+        status=status,
+        start_time=start_time,
+        end_time=end_time,
+        limit=limit
+    )
+    return build_deposit_history_df(deposits)
 
 
 def register_binance_get_deposit_history(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
@@ -252,7 +341,7 @@ def register_binance_get_deposit_history(local_mcp_instance, local_binance_clien
         logger.info(f"binance_get_deposit_history tool invoked by {requester} - coin: {coin}, status: {status}")
 
         # Call fetch function
-        df = fetch_deposit_history(
+        deposits = fetch_deposit_records(
             binance_client=local_binance_client,
             coin=coin,
             status=status,
@@ -261,20 +350,31 @@ def register_binance_get_deposit_history(local_mcp_instance, local_binance_clien
             limit=limit
         )
 
-        if df.empty:
+        if not deposits:
             return f"No deposit history found for the specified parameters (coin: {coin}, status: {status})."
 
         # Generate filename with unique identifier
         coin_suffix = f"_{coin}" if coin else ""
-        filename = f"deposit_history{coin_suffix}_{str(uuid.uuid4())[:8]}.csv"
+        filename = f"deposit_history{coin_suffix}_{unique_file_suffix()}.csv"
         filepath = csv_dir / filename
 
-        # Save to CSV file
-        df.to_csv(filepath, index=False)
-        logger.info(f"Saved deposit history to {filename} ({len(df)} records)")
+        if len(deposits) <= SMALL_RESULT_MAX_ROWS:
+            # Few rows: write them straight with the csv module, no DataFrame
+            rows = build_deposit_history_rows(deposits)
+            csv_size = write_csv_rows(filepath, rows[0].keys(), (row.values() for row in rows))
+            result = format_csv_response(filepath, rows, file_size=csv_size)
+        else:
+            df = build_deposit_history_df(deposits)
+
+            # Save to CSV file in the background while the response is built
+            csv_future, csv_size = submit_csv_write(filepath, df)
+
+            # Return formatted response
+            result = format_csv_response(filepath, df, file_size=csv_size)
+
+            csv_future.result()
 
-        # Return formatted response
-        result = format_csv_response(filepath, df)
+        logger.info(f"Saved deposit history to {filename} ({len(deposits)} records)")
 
         # Log the request for audit trail
         log_request(
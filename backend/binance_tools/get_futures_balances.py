@@ -1,21 +1,139 @@
 import logging
-from datetime import datetime
-from decimal import Decimal
-import uuid
-from mcp_service import format_csv_response
+from mcp_service import format_csv_response, submit_csv_rows_write, dataframe_rows, format_ms_timestamp, format_ms_timestamps, unique_file_suffix
 from request_logger import log_request
+import numpy as np
 import pandas as pd
 from binance.client import Client
 from sentry_utils import with_sentry_tracing
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
 # Simple in-memory cache for rate limiting
 # Format: {'last_call_time': timestamp, 'account_df': df, 'positions_df': df}
+# Cached frames are shared, not deep-copied: readers get shallow copies, so
+# adding/dropping columns is safe but values must not be modified in place
+# last_call_time is on the time.monotonic() clock so NTP adjustments cannot skew the TTL
 _futures_balances_cache = {'last_call_time': 0, 'account_df': None, 'positions_df': None}
 _CACHE_TTL_SECONDS = 5  # Cache data for 5 seconds
 
+# Guards the cache; concurrent callers that miss it wait for the one live fetch
+# in flight (_fetch_done is cleared while it runs) instead of issuing their own
+_cache_lock = threading.Lock()
+_fetch_done = threading.Event()
+_fetch_done.set()
+
+# Position fields read from the futures account response, in output order
+# (liqDistancePct is derived and inserted after liquidationPrice)
+POSITION_API_COLUMNS = [
+    'symbol', 'positionAmt', 'positionSide', 'entryPrice', 'markPrice',
+    'liquidationPrice', 'unRealizedProfit', 'leverage',
+    'initialMargin', 'maintMargin', 'isolated', 'updateTime'
+]
+POSITION_FLOAT_COLUMNS = [
+    'positionAmt', 'entryPrice', 'markPrice', 'liquidationPrice',
+    'unRealizedProfit', 'initialMargin', 'maintMargin'
+]
+
+# Decimal places kept for derived ratios (margin ratio, leverage, liquidation distance)
+RATIO_DECIMALS = 12
+
+# Column dtypes of the positions frame, used for the shared empty template
+POSITION_OUTPUT_DTYPES = {
+    'symbol': 'object', 'positionAmt': 'float64', 'positionSide': 'object',
+    'entryPrice': 'float64', 'markPrice': 'float64', 'liquidationPrice': 'float64',
+    'liqDistancePct': 'float64', 'unRealizedProfit': 'float64', 'leverage': 'int64',
+    'initialMargin': 'float64', 'maintMargin': 'float64', 'isolated': 'bool', 'updateTime': 'object'
+}
+_empty_positions_template = None
+
+# Risk assessment line per margin ratio bucket, highest threshold first
+_MARGIN_RATIO_MESSAGES = (
+    (80, "🚨 CRITICAL: Margin ratio very high - liquidation risk!\n"),
+    (60, "⚠️  WARNING: High margin ratio - consider reducing positions\n"),
+    (40, "⚡ CAUTION: Moderate margin usage\n"),
+)
+_HEALTHY_MARGIN_MESSAGE = "✓  Healthy margin ratio\n"
+
+_BANNER = "═" * 79
+
+# Tool response layout, built once; the risk assessment lines follow the header
+_RESPONSE_HEADER = f"""{_BANNER}
+FUTURES ACCOUNT DATA SAVED{{cache_status}}
+{_BANNER}
+
+File 1: ACCOUNT SUMMARY
+{{account_response}}
+
+File 2: OPEN POSITIONS ({{position_count}} positions)
+{{positions_response}}
+
+{_BANNER}
+RISK ASSESSMENT
+{_BANNER}
+"""
+_RESPONSE_FOOTER = f"{_BANNER}\n"
+
+
+def _margin_ratio_message(margin_ratio: float) -> str:
+    """Return the risk assessment line for a margin ratio (in percent)."""
+    for threshold, message in _MARGIN_RATIO_MESSAGES:
+        if margin_ratio >= threshold:
+            return message
+    return _HEALTHY_MARGIN_MESSAGE
+
+
+def invalidate_futures_balances_cache() -> None:
+    """Drop the cached account and positions; call after a futures order, cancel or leverage change."""
+    with _cache_lock:
+        _futures_balances_cache['account_df'] = None
+        _futures_balances_cache['positions_df'] = None
+
+
+def _empty_positions_df() -> pd.DataFrame:
+    """Return a (shallow copy of a) typed, empty positions frame, built once per process."""
+    global _empty_positions_template
+    if _empty_positions_template is None:
+        _empty_positions_template = pd.DataFrame(
+            {column: pd.Series(dtype=dtype) for column, dtype in POSITION_OUTPUT_DTYPES.items()}
+        )
+    return _empty_positions_template.copy(deep=False)
+
+
+def _build_positions_df(positions: list) -> pd.DataFrame:
+    """Build the open-positions frame from the futures account's per-symbol position list."""
+    # Keep only non-zero positions; most symbols have none, so only positionAmt
+    # is parsed for every entry and the frame is built from the open ones
+    position_amt = np.fromiter((position['positionAmt'] for position in positions), dtype=np.float64, count=len(positions))
+    open_indices = np.flatnonzero(position_amt)
+    if not len(open_indices):
+        return _empty_positions_df()
+
+    positions_df = pd.DataFrame.from_records([positions[i] for i in open_indices], columns=POSITION_API_COLUMNS)
+
+    # Parse all numeric string columns in one batch conversion
+    positions_df[POSITION_FLOAT_COLUMNS] = positions_df[POSITION_FLOAT_COLUMNS].astype('float64')
+
+    # '0' is Binance's sentinel for "no liquidation price"
+    liquidation_price = positions_df['liquidationPrice'].where(positions_df['liquidationPrice'] != 0)
+    mark_price = positions_df['markPrice']
+    positions_df['liquidationPrice'] = liquidation_price
+
+    # Calculate liquidation distance (NaN without a liquidation price or mark price)
+    liq_distance = ((liquidation_price - mark_price) / mark_price * 100).abs().round(RATIO_DECIMALS)
+    positions_df.insert(
+        positions_df.columns.get_loc('liquidationPrice') + 1,
+        'liqDistancePct',
+        liq_distance.where(mark_price > 0)
+    )
+
+    positions_df['leverage'] = positions_df['leverage'].astype('int64')
+    # Format all position timestamps in one vectorized pass
+    positions_df['updateTime'] = format_ms_timestamps(positions_df['updateTime'].astype('int64'))
+
+    return positions_df
+
 
 @with_sentry_tracing("binance_get_futures_balances")
 def fetch_futures_balances(binance_client: Client, use_cache: bool = True) -> tuple[pd.DataFrame, pd.DataFrame, bool]:
@@ -36,23 +154,33 @@ def fetch_futures_balances(binance_client: Client, use_cache: bool = True) -> tu
         Futures trading involves liquidation risk. Monitor positions carefully.
         This function implements a 5-second cache to prevent rate limit errors.
     """
-    global _futures_balances_cache
-    current_time = time.time()
-
-    # Check if we can use cached data
-    if use_cache and _futures_balances_cache['account_df'] is not None:
-        time_since_last_call = current_time - _futures_balances_cache['last_call_time']
-        if time_since_last_call < _CACHE_TTL_SECONDS:
-            logger.info(f"Using cached futures balance data (age: {time_since_last_call:.1f}s)")
-            return (
-                _futures_balances_cache['account_df'].copy(),
-                _futures_balances_cache['positions_df'].copy(),
-                True  # is_cached = True
-            )
-
-    logger.info("Fetching Binance futures account information (live)")
-
+    while True:
+        with _cache_lock:
+            # Check if we can use cached data
+            if use_cache and _futures_balances_cache['account_df'] is not None:
+                time_since_last_call = time.monotonic() - _futures_balances_cache['last_call_time']
+                if time_since_last_call < _CACHE_TTL_SECONDS:
+                    logger.info(f"Using cached futures balance data (age: {time_since_last_call:.1f}s)")
+                    return (
+                        _futures_balances_cache['account_df'].copy(deep=False),
+                        _futures_balances_cache['positions_df'].copy(deep=False),
+                        True  # is_cached = True
+                    )
+
+            # Become the single live fetcher unless another call already is
+            if _fetch_done.is_set():
+                _fetch_done.clear()
+                break
+
+        # Another call is fetching; wait for it, then re-check the cache
+        _fetch_done.wait()
+
+    # Everything after _fetch_done.clear() runs inside the try, so the finally
+    # always wakes the waiters
     try:
+        current_time = time.monotonic()
+        logger.info("Fetching Binance futures account information (live)")
+
         # Fetch account information from Binance API
         account = binance_client.futures_account()
 
@@ -64,7 +192,7 @@ def fetch_futures_balances(binance_client: Client, use_cache: bool = True) -> tu
 
         # Account summary record
         account_record = {
-            'timestamp': datetime.fromtimestamp(account['updateTime'] / 1000).strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': format_ms_timestamp(account['updateTime']),
             'canTrade': account.get('canTrade', False),
             'canDeposit': account.get('canDeposit', False),
             'canWithdraw': account.get('canWithdraw', False),
@@ -79,70 +207,37 @@ def fetch_futures_balances(binance_client: Client, use_cache: bool = True) -> tu
         }
 
         # Calculate risk metrics
-        total_margin_balance = Decimal(account['totalMarginBalance'])
-        total_maint_margin = Decimal(account['totalMaintMargin'])
+        total_margin_balance = account_record['totalMarginBalance']
+        total_maint_margin = account_record['totalMaintMargin']
         if total_margin_balance > 0 and total_maint_margin > 0:
-            margin_ratio = float((total_maint_margin / total_margin_balance) * 100)
+            # Ratios are rounded so float noise never reaches the CSV
+            margin_ratio = round(total_maint_margin / total_margin_balance * 100, RATIO_DECIMALS)
             account_record['marginRatio'] = margin_ratio
         else:
             account_record['marginRatio'] = 0.0
 
         # Calculate effective leverage
-        total_initial_margin = Decimal(account['totalInitialMargin'])
-        total_wallet_balance = Decimal(account['totalWalletBalance'])
+        total_initial_margin = account_record['totalInitialMargin']
+        total_wallet_balance = account_record['totalWalletBalance']
         if total_initial_margin > 0 and total_wallet_balance > 0:
-            effective_leverage = float(total_initial_margin / total_wallet_balance)
+            effective_leverage = round(total_initial_margin / total_wallet_balance, RATIO_DECIMALS)
             account_record['effectiveLeverage'] = effective_leverage
         else:
             account_record['effectiveLeverage'] = 0.0
 
         account_df = pd.DataFrame([account_record])
 
-        # Process open positions
-        position_records = []
-        for position in account['positions']:
-            pos_amt = Decimal(position['positionAmt'])
-            if pos_amt != 0:
-                entry_price = Decimal(position['entryPrice'])
-                mark_price = Decimal(position['markPrice'])
-                liquidation_price = Decimal(position['liquidationPrice']) if position['liquidationPrice'] != '0' else None
-
-                # Calculate liquidation distance
-                if liquidation_price and mark_price > 0:
-                    liq_distance = float(abs((liquidation_price - mark_price) / mark_price * 100))
-                else:
-                    liq_distance = None
-
-                position_records.append({
-                    'symbol': position['symbol'],
-                    'positionAmt': float(pos_amt),
-                    'positionSide': position['positionSide'],
-                    'entryPrice': float(entry_price),
-                    'markPrice': float(mark_price),
-                    'liquidationPrice': float(liquidation_price) if liquidation_price else None,
-                    'liqDistancePct': liq_distance,
-                    'unRealizedProfit': float(position['unRealizedProfit']),
-                    'leverage': int(position['leverage']),
-                    'initialMargin': float(position['initialMargin']),
-                    'maintMargin': float(position['maintMargin']),
-                    'isolated': position['isolated'],
-                    'updateTime': datetime.fromtimestamp(int(position['updateTime']) / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                })
-
-        positions_df = pd.DataFrame(position_records) if position_records else pd.DataFrame(columns=[
-            'symbol', 'positionAmt', 'positionSide', 'entryPrice', 'markPrice',
-            'liquidationPrice', 'liqDistancePct', 'unRealizedProfit', 'leverage',
-            'initialMargin', 'maintMargin', 'isolated', 'updateTime'
-        ])
-
-        logger.info(f"Successfully fetched futures account data with {len(position_records)} open positions")
+        positions_df = _build_positions_df(account['positions'])
+
+        logger.info(f"Successfully fetched futures account data with {len(positions_df)} open positions")
 
         # Update cache
-        _futures_balances_cache['last_call_time'] = current_time
-        _futures_balances_cache['account_df'] = account_df.copy()
-        _futures_balances_cache['positions_df'] = positions_df.copy()
+        with _cache_lock:
+            _futures_balances_cache['last_call_time'] = current_time
+            _futures_balances_cache['account_df'] = account_df
+            _futures_balances_cache['positions_df'] = positions_df
 
-        return account_df, positions_df, False  # is_cached = False
+        return account_df.copy(deep=False), positions_df.copy(deep=False), False  # is_cached = False
 
     except Exception as e:
         error_str = str(e)
@@ -152,14 +247,15 @@ def fetch_futures_balances(binance_client: Client, use_cache: bool = True) -> tu
             logger.warning(f"Binance rate limit hit: {e}")
 
             # If we have cached data, return it even if expired
-            if _futures_balances_cache['account_df'] is not None:
-                time_since_last_call = current_time - _futures_balances_cache['last_call_time']
-                logger.info(f"Returning cached data due to rate limit (age: {time_since_last_call:.1f}s)")
-                return (
-                    _futures_balances_cache['account_df'].copy(),
-                    _futures_balances_cache['positions_df'].copy(),
-                    True  # is_cached = True
-                )
+            with _cache_lock:
+                if _futures_balances_cache['account_df'] is not None:
+                    time_since_last_call = current_time - _futures_balances_cache['last_call_time']
+                    logger.info(f"Returning cached data due to rate limit (age: {time_since_last_call:.1f}s)")
+                    return (
+                        _futures_balances_cache['account_df'].copy(deep=False),
+                        _futures_balances_cache['positions_df'].copy(deep=False),
+                        True  # is_cached = True
+                    )
 
             # No cached data available, raise specific rate limit error
             raise ValueError(
@@ -170,6 +266,10 @@ def fetch_futures_balances(binance_client: Client, use_cache: bool = True) -> tu
         logger.error(f"Error fetching futures account data from Binance API: {e}")
         raise
 
+    finally:
+        # Wake any callers waiting on this fetch
+        _fetch_done.set()
+
 
 def register_binance_get_futures_balances(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
     """Register the binance_get_futures_balances tool"""
@@ -262,59 +362,55 @@ def register_binance_get_futures_balances(local_mcp_instance, local_binance_clie
             account_df, positions_df, is_cached = fetch_futures_balances(binance_client=local_binance_client)
 
             # Generate filenames with unique identifier
-            uid = str(uuid.uuid4())[:8]
+            uid = unique_file_suffix()
             account_filename = f"futures_account_{uid}.csv"
             positions_filename = f"futures_positions_{uid}.csv"
             account_filepath = csv_dir / account_filename
             positions_filepath = csv_dir / positions_filename
 
-            # Save to CSV files
-            account_df.to_csv(account_filepath, index=False)
-            positions_df.to_csv(positions_filepath, index=False)
-
-            logger.info(f"Saved futures account data to {account_filename}")
-            logger.info(f"Saved {len(positions_df)} positions to {positions_filename}")
+            # Save to CSV files in the background while the responses are built
+            # (stdlib csv writer; both frames are far too small for pandas' CSV engine to pay off)
+            account_future, account_size = submit_csv_rows_write(
+                account_filepath, account_df.columns, dataframe_rows(account_df)
+            )
+            positions_future, positions_size = submit_csv_rows_write(
+                positions_filepath, positions_df.columns, dataframe_rows(positions_df)
+            )
 
             # Build combined response
-            account_response = format_csv_response(account_filepath, account_df)
-            positions_response = format_csv_response(positions_filepath, positions_df)
+            account_response = format_csv_response(account_filepath, account_df, file_size=account_size)
+            positions_response = format_csv_response(positions_filepath, positions_df, file_size=positions_size)
 
             # Add cache status indicator
             cache_status = " (CACHED DATA)" if is_cached else " (LIVE DATA)"
 
-            result = f"""═══════════════════════════════════════════════════════════════════════════════
-FUTURES ACCOUNT DATA SAVED{cache_status}
-═══════════════════════════════════════════════════════════════════════════════
-
-File 1: ACCOUNT SUMMARY
-{account_response}
-
-File 2: OPEN POSITIONS ({len(positions_df)} positions)
-{positions_response}
-
-═══════════════════════════════════════════════════════════════════════════════
-RISK ASSESSMENT
-═══════════════════════════════════════════════════════════════════════════════
-"""
+            risk_lines = []
 
             # Add risk warnings
             if not account_df.empty:
-                margin_ratio = account_df.iloc[0]['marginRatio']
-                if margin_ratio >= 80:
-                    result += "🚨 CRITICAL: Margin ratio very high - liquidation risk!\n"
-                elif margin_ratio >= 60:
-                    result += "⚠️  WARNING: High margin ratio - consider reducing positions\n"
-                elif margin_ratio >= 40:
-                    result += "⚡ CAUTION: Moderate margin usage\n"
-                else:
-                    result += "✓  Healthy margin ratio\n"
+                risk_lines.append(_margin_ratio_message(account_df.iloc[0]['marginRatio']))
 
             if not positions_df.empty:
-                critical_positions = len(positions_df[positions_df['liqDistancePct'] < 10])
+                critical_positions = int((positions_df['liqDistancePct'] < 10).sum())
                 if critical_positions > 0:
-                    result += f"🚨 WARNING: {critical_positions} position(s) within 10% of liquidation!\n"
-
-            result += "═══════════════════════════════════════════════════════════════════════════════\n"
+                    risk_lines.append(f"🚨 WARNING: {critical_positions} position(s) within 10% of liquidation!\n")
+
+            result = "".join((
+                _RESPONSE_HEADER.format(
+                    cache_status=cache_status,
+                    account_response=account_response,
+                    position_count=len(positions_df),
+                    positions_response=positions_response
+                ),
+                *risk_lines,
+                _RESPONSE_FOOTER
+            ))
+
+            # Make sure both files are on disk before the response points at them
+            account_future.result()
+            positions_future.result()
+            logger.info(f"Saved futures account data to {account_filename}")
+            logger.info(f"Saved {len(positions_df)} positions to {positions_filename}")
 
             log_request(
                 requests_dir=requests_dir,
@@ -1,8 +1,9 @@
 import logging
-from datetime import datetime
-import uuid
-from mcp_service import format_csv_response
+import os
+import time
+from mcp_service import format_csv_response, format_ms_timestamps, unique_file_suffix, write_csv_rows, dataframe_rows
 from request_logger import log_request
+import numpy as np
 import pandas as pd
 from binance.client import Client
 from typing import Optional
@@ -10,6 +11,143 @@ from sentry_utils import with_sentry_tracing
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache of the all-symbols Algo Service response; per-symbol calls
+# are filtered from it, so checking several symbols in a row costs one request.
+# The TTL is capped because orders can be triggered or cancelled at any moment
+# Format: {'last_call_time': timestamp, 'orders': list of raw algo orders}
+_algo_orders_cache = {'last_call_time': 0, 'orders': None}
+_MAX_CACHE_TTL_SECONDS = 5
+
+# Algo Service order fields in output order
+# (algoId, orderType, triggerPrice, algoStatus, createTime, clientAlgoId, ...)
+CONDITIONAL_ORDER_COLUMNS = [
+    'algoId', 'clientAlgoId', 'symbol', 'side', 'positionSide', 'orderType',
+    'algoType', 'triggerPrice', 'price', 'quantity', 'actualQty', 'algoStatus',
+    'reduceOnly', 'closePosition', 'workingType', 'priceProtect', 'timeInForce',
+    'createTime', 'updateTime'
+]
+CONDITIONAL_ORDER_FLOAT_COLUMNS = ['triggerPrice', 'price', 'quantity', 'actualQty']
+CONDITIONAL_ORDER_BOOL_COLUMNS = ['reduceOnly', 'closePosition', 'priceProtect']
+
+# Values used when the Algo Service omits a field
+CONDITIONAL_ORDER_DEFAULTS = {
+    'algoId': '',
+    'clientAlgoId': '',
+    'positionSide': 'BOTH',
+    'orderType': '',  # TAKE_PROFIT_MARKET, STOP_MARKET, TRAILING_STOP_MARKET
+    'algoType': 'CONDITIONAL',
+    'algoStatus': 'NEW',
+    'workingType': 'MARK_PRICE',
+    'timeInForce': ''
+}
+
+# Column dtypes of the orders frame, used for the shared empty template
+CONDITIONAL_ORDER_OUTPUT_DTYPES = {
+    'algoId': 'int64', 'clientAlgoId': 'object', 'symbol': 'object', 'side': 'object',
+    'positionSide': 'object', 'orderType': 'object', 'algoType': 'object',
+    'triggerPrice': 'float64', 'price': 'float64', 'quantity': 'float64', 'actualQty': 'float64',
+    'algoStatus': 'object', 'reduceOnly': 'bool', 'closePosition': 'bool', 'workingType': 'object',
+    'priceProtect': 'bool', 'timeInForce': 'object', 'createTime': 'object', 'updateTime': 'object'
+}
+_empty_orders_template = None
+
+_BANNER = "═" * 79
+
+# Tool response sections, built once
+_NO_ORDERS_HEADER = f"""{_BANNER}
+NO OPEN CONDITIONAL ORDERS
+{_BANNER}
+"""
+_NO_ORDERS_FOOTER = f"""
+This means no STOP_MARKET, TAKE_PROFIT_MARKET, or TRAILING_STOP_MARKET orders.
+
+⚠️  If you have open positions without stop-loss orders, consider adding them!
+
+To place a stop-loss order:
+  binance_futures_stop_order(symbol="BTCUSDT", side="SELL", order_type="STOP_MARKET",
+                            stop_price=90000, close_position=True, position_side="LONG")
+
+To check basic orders (LIMIT, MARKET):
+  binance_get_futures_open_orders()
+
+{_BANNER}
+"""
+_SUMMARY_HEADER = f"""
+
+{_BANNER}
+CONDITIONAL ORDERS SUMMARY
+{_BANNER}
+Total Conditional Orders:  {{total_orders}}
+Close Position Orders:     {{close_position_count}}
+
+By Order Type:
+"""
+_SUMMARY_FOOTER = f"""
+{_BANNER}
+
+To cancel a conditional order:
+  binance_cancel_algo_order(symbol="SYMBOL", algo_id=ALGO_ID)
+
+To check basic orders (LIMIT, MARKET):
+  binance_get_futures_open_orders()
+
+{_BANNER}
+"""
+
+
+def _empty_conditional_orders_df() -> pd.DataFrame:
+    """Return a (shallow copy of a) typed, empty conditional orders frame, built once per process."""
+    global _empty_orders_template
+    if _empty_orders_template is None:
+        _empty_orders_template = pd.DataFrame(
+            {column: pd.Series(dtype=dtype) for column, dtype in CONDITIONAL_ORDER_OUTPUT_DTYPES.items()}
+        )
+    return _empty_orders_template.copy(deep=False)
+
+
+def _sorted_counts(column: pd.Series) -> list:
+    """Return (value, count) pairs for a small column in sorted value order, without pandas' Series overhead."""
+    values, counts = np.unique(column.to_numpy(), return_counts=True)
+    return list(zip(values.tolist(), counts.tolist()))
+
+
+def invalidate_conditional_orders_cache() -> None:
+    """Drop the cached Algo Service response; call after placing or cancelling an algo order."""
+    _algo_orders_cache['orders'] = None
+
+
+def _cached_all_algo_orders(binance_client: Client) -> list:
+    """Return all open algo orders, from the short-lived cache when it is fresh."""
+    current_time = time.monotonic()
+    cache_ttl = min(float(os.getenv('BINANCE_CONDITIONAL_ORDERS_CACHE_TTL', '3')), _MAX_CACHE_TTL_SECONDS)
+
+    # Check if we can use cached data
+    cached_orders = _algo_orders_cache['orders']
+    age = current_time - _algo_orders_cache['last_call_time']
+    if cached_orders is not None and age < cache_ttl:
+        logger.info(f"Using cached futures conditional orders (age: {age:.1f}s)")
+        return cached_orders
+
+    try:
+        # Direct API call to the Algo Service endpoint
+        # python-binance may not have this endpoint yet, so we use _request_futures_api
+        orders = binance_client._request_futures_api('get', 'openAlgoOrders', signed=True, data={})
+
+    except Exception as e:
+        error_str = str(e).lower()
+
+        # On a rate limit, fall back to the last response even if it has expired
+        if cached_orders is not None and ("429" in error_str or "rate" in error_str or "too many requests" in error_str):
+            logger.warning(f"Binance rate limit hit, returning cached conditional orders (age: {age:.1f}s)")
+            return cached_orders
+        raise
+
+    # Update cache
+    _algo_orders_cache['last_call_time'] = current_time
+    _algo_orders_cache['orders'] = orders
+
+    return orders
+
 
 @with_sentry_tracing("binance_get_futures_conditional_orders")
 def fetch_futures_conditional_orders(binance_client: Client, symbol: Optional[str] = None) -> pd.DataFrame:
@@ -28,53 +166,37 @@ def fetch_futures_conditional_orders(binance_client: Client, symbol: Optional[st
         As of December 9, 2025, Binance moved conditional orders (STOP_MARKET,
         TAKE_PROFIT_MARKET, TRAILING_STOP_MARKET) to the Algo Service.
         Basic orders (LIMIT, MARKET) are returned by get_futures_open_orders.
+
+        Orders for all symbols are fetched with one request and cached for
+        BINANCE_CONDITIONAL_ORDERS_CACHE_TTL seconds (default 3, at most 5);
+        a symbol filter is applied locally. If Binance rate-limits the
+        request, the last cached response is used even if it has expired.
     """
     logger.info(f"Fetching futures conditional orders" + (f" for {symbol}" if symbol else ""))
 
     try:
-        # Build parameters
-        params = {}
-        if symbol:
-            params['symbol'] = symbol
+        orders = _cached_all_algo_orders(binance_client)
 
-        # Direct API call to the Algo Service endpoint
-        # python-binance may not have this endpoint yet, so we use _request_futures_api
-        orders = binance_client._request_futures_api('get', 'openAlgoOrders', signed=True, data=params)
-
-        records = []
-        for order in orders:
-            # Map Algo Service response fields to our standard format
-            # Algo Service uses: algoId, orderType, triggerPrice, algoStatus, createTime, clientAlgoId
-            records.append({
-                'algoId': order.get('algoId', ''),
-                'clientAlgoId': order.get('clientAlgoId', ''),
-                'symbol': order['symbol'],
-                'side': order['side'],
-                'positionSide': order.get('positionSide', 'BOTH'),
-                'orderType': order.get('orderType', ''),  # TAKE_PROFIT_MARKET, STOP_MARKET, TRAILING_STOP_MARKET
-                'algoType': order.get('algoType', 'CONDITIONAL'),
-                'triggerPrice': float(order.get('triggerPrice', 0)),
-                'price': float(order.get('price', 0)),
-                'quantity': float(order.get('quantity', 0)),
-                'actualQty': float(order.get('actualQty', 0)),
-                'algoStatus': order.get('algoStatus', 'NEW'),
-                'reduceOnly': order.get('reduceOnly', False),
-                'closePosition': order.get('closePosition', False),
-                'workingType': order.get('workingType', 'MARK_PRICE'),
-                'priceProtect': order.get('priceProtect', False),
-                'timeInForce': order.get('timeInForce', ''),
-                'createTime': datetime.fromtimestamp(order['createTime'] / 1000).strftime('%Y-%m-%d %H:%M:%S') if order.get('createTime') else '',
-                'updateTime': datetime.fromtimestamp(order['updateTime'] / 1000).strftime('%Y-%m-%d %H:%M:%S') if order.get('updateTime') else ''
-            })
-
-        df = pd.DataFrame(records) if records else pd.DataFrame(columns=[
-            'algoId', 'clientAlgoId', 'symbol', 'side', 'positionSide', 'orderType',
-            'algoType', 'triggerPrice', 'price', 'quantity', 'actualQty', 'algoStatus',
-            'reduceOnly', 'closePosition', 'workingType', 'priceProtect', 'timeInForce',
-            'createTime', 'updateTime'
-        ])
-
-        logger.info(f"Retrieved {len(records)} conditional futures orders")
+        if symbol:
+            symbol = symbol.upper()
+            orders = [order for order in orders if order.get('symbol') == symbol]
+
+        if not orders:
+            df = _empty_conditional_orders_df()
+        else:
+            # Build the frame in one pass from the API records, then fill defaults
+            # and convert types column-wise
+            df = pd.DataFrame.from_records(orders, columns=CONDITIONAL_ORDER_COLUMNS)
+            for column, default in CONDITIONAL_ORDER_DEFAULTS.items():
+                df[column] = df[column].fillna(default)
+            df[CONDITIONAL_ORDER_FLOAT_COLUMNS] = df[CONDITIONAL_ORDER_FLOAT_COLUMNS].fillna(0).astype('float64')
+            df[CONDITIONAL_ORDER_BOOL_COLUMNS] = df[CONDITIONAL_ORDER_BOOL_COLUMNS].fillna(False).astype(bool)
+
+            # Convert timestamps to readable format ('' when absent)
+            df['createTime'] = format_ms_timestamps(df['createTime'], blank_zero=True).fillna('')
+            df['updateTime'] = format_ms_timestamps(df['updateTime'], blank_zero=True).fillna('')
+
+        logger.info(f"Retrieved {len(df)} conditional futures orders")
 
         return df
 
@@ -104,7 +226,8 @@ def register_binance_get_futures_conditional_orders(local_mcp_instance, local_bi
                 - If omitted: Shows all conditional orders across all symbols
 
         Returns:
-            str: Formatted response with CSV file containing conditional orders.
+            str: Formatted response with CSV file containing conditional orders,
+                or a short notice without a file when there are none.
 
         CSV Output Columns:
             - algoId (integer): Algo order identifier (use for cancellation)
@@ -197,103 +320,68 @@ def register_binance_get_futures_conditional_orders(local_mcp_instance, local_bi
                 symbol=symbol
             )
 
+            # Nothing to save: skip the CSV file and its schema/sample section
+            if df.empty:
+                scope = f"No conditional orders found for {symbol}.\n" if symbol else "No conditional futures orders found.\n"
+                return "".join((_NO_ORDERS_HEADER, scope, _NO_ORDERS_FOOTER))
+
             # Generate filename
             if symbol:
-                filename = f"futures_conditional_orders_{symbol}_{str(uuid.uuid4())[:8]}.csv"
+                filename = f"futures_conditional_orders_{symbol}_{unique_file_suffix()}.csv"
             else:
-                filename = f"futures_conditional_orders_all_{str(uuid.uuid4())[:8]}.csv"
+                filename = f"futures_conditional_orders_all_{unique_file_suffix()}.csv"
 
             filepath = csv_dir / filename
 
-            # Save to CSV
-            df.to_csv(filepath, index=False)
+            # Save to CSV with the stdlib csv writer (at most a few hundred rows)
+            file_size = write_csv_rows(filepath, df.columns, dataframe_rows(df))
             logger.info(f"Saved futures conditional orders to {filename}")
 
             # Return formatted response
-            result = format_csv_response(filepath, df)
-
-            if df.empty:
-                summary = f"""
-
-═══════════════════════════════════════════════════════════════════════════════
-NO OPEN CONDITIONAL ORDERS
-═══════════════════════════════════════════════════════════════════════════════
-"""
-                if symbol:
-                    summary += f"No conditional orders found for {symbol}.\n"
-                else:
-                    summary += "No conditional futures orders found.\n"
-                summary += """
-This means no STOP_MARKET, TAKE_PROFIT_MARKET, or TRAILING_STOP_MARKET orders.
-
-⚠️  If you have open positions without stop-loss orders, consider adding them!
-
-To place a stop-loss order:
-  binance_futures_stop_order(symbol="BTCUSDT", side="SELL", order_type="STOP_MARKET",
-                            stop_price=90000, close_position=True, position_side="LONG")
-
-To check basic orders (LIMIT, MARKET):
-  binance_get_futures_open_orders()
-
-═══════════════════════════════════════════════════════════════════════════════
-"""
-                return result + summary
+            result = format_csv_response(filepath, df, file_size=file_size)
 
             # Calculate summary statistics
             total_orders = len(df)
-            by_type = df['orderType'].value_counts().to_dict()
-            by_symbol = df['symbol'].value_counts().to_dict()
-            close_position_count = len(df[df['closePosition'] == True])
+            by_type = _sorted_counts(df['orderType'])
+            by_symbol = _sorted_counts(df['symbol'])
+            close_position_count = int(df['closePosition'].sum())
 
-            summary = f"""
+            # Collect response pieces and join once at the end
+            parts = [result, _SUMMARY_HEADER.format(
+                total_orders=total_orders,
+                close_position_count=close_position_count
+            )]
 
-═══════════════════════════════════════════════════════════════════════════════
-CONDITIONAL ORDERS SUMMARY
-═══════════════════════════════════════════════════════════════════════════════
-Total Conditional Orders:  {total_orders}
-Close Position Orders:     {close_position_count}
-
-By Order Type:
-"""
-
-            for order_type, count in sorted(by_type.items()):
+            for order_type, count in by_type:
                 type_display = order_type.replace('_MARKET', '').replace('_', ' ')
-                summary += f"  {type_display}: {count}\n"
-
-            summary += "\nBy Symbol:\n"
-            for sym, count in sorted(by_symbol.items()):
-                summary += f"  {sym}: {count} order(s)\n"
-
-            # List order details
-            summary += "\nOrder Details:\n"
-            for _, row in df.iterrows():
-                order_type_display = row['orderType'].replace('_MARKET', '')
-                trigger_info = f"@ {row['triggerPrice']}"
-
-                qty_info = "CLOSE ALL" if row['closePosition'] else f"Qty: {row['quantity']}"
-                summary += f"  {row['symbol']} {row['side']} {order_type_display} {trigger_info} [{qty_info}]\n"
-
-            summary += """
-═══════════════════════════════════════════════════════════════════════════════
-
-To cancel a conditional order:
-  binance_cancel_algo_order(symbol="SYMBOL", algo_id=ALGO_ID)
-
-To check basic orders (LIMIT, MARKET):
-  binance_get_futures_open_orders()
+                parts.append(f"  {type_display}: {count}\n")
+
+            parts.append("\nBy Symbol:\n")
+            for sym, count in by_symbol:
+                parts.append(f"  {sym}: {count} order(s)\n")
+
+            # List order details, formatted column-wise
+            order_type_display = df['orderType'].str.replace('_MARKET', '', regex=False)
+            qty_info = ('Qty: ' + df['quantity'].astype(str)).where(~df['closePosition'], 'CLOSE ALL')
+            lines = (
+                '  ' + df['symbol'] + ' ' + df['side'] + ' ' + order_type_display
+                + ' @ ' + df['triggerPrice'].astype(str) + ' [' + qty_info + ']\n'
+            )
+            parts.append("\nOrder Details:\n")
+            parts.extend(lines.tolist())
 
-═══════════════════════════════════════════════════════════════════════════════
-"""
+            parts.append(_SUMMARY_FOOTER)
+            response = "".join(parts)
 
             log_request(
                 requests_dir=requests_dir,
                 requester=requester,
                 tool_name="binance_get_futures_conditional_orders",
                 input_params={"symbol": symbol},
-                output_result=result + summary
+                output_result=response
             )
 
-            return result + summary
+            return response
 
         except Exception as e:
             logger.error(f"Error fetching futures conditional orders: {e}")
@@ -1,78 +1,254 @@
 import logging
-from datetime import datetime
+import math
+from collections import Counter
+import os
+import threading
+import time
 import uuid
-from mcp_service import format_csv_response
+from mcp_service import format_csv_response, format_ms_timestamp, format_ms_timestamps, write_csv_rows, dataframe_rows
 from request_logger import log_request
+import numpy as np
 import pandas as pd
 from binance.client import Client
-from typing import Optional
+from typing import List, Optional
 from sentry_utils import with_sentry_tracing
 
 logger = logging.getLogger(__name__)
 
+# Short-lived per-symbol cache of raw open orders so back-to-back calls skip
+# the API (None is the all-symbols key, and a fresh all-symbols entry also
+# serves single-symbol calls); the TTL is capped because orders can fill or
+# be cancelled at any moment
+# Format: {symbol: (timestamp, orders)}
+_open_orders_cache = {}
+_cache_lock = threading.Lock()
+# Bumped by every invalidation; a fetch that started before one does not store its result
+_cache_generation = 0
+_MAX_CACHE_TTL_SECONDS = 5
+
+# Results up to this many orders are written straight from plain rows with
+# the csv module; larger ones go through a DataFrame
+SMALL_RESULT_MAX_ROWS = 16
+
+_empty_open_orders_template = None
+
+_BANNER = "═" * 79
+
+# Tool response sections, built once
+_NO_ORDERS_HEADER = f"""{_BANNER}
+NO OPEN BASIC FUTURES ORDERS
+{_BANNER}
+"""
+_NO_ORDERS_FOOTER = f"""
+💡 Looking for stop-loss or take-profit orders?
+   Use binance_get_futures_conditional_orders() instead!
+
+   Since December 2025, Binance serves conditional orders
+   (STOP_MARKET, TAKE_PROFIT_MARKET, TRAILING_STOP_MARKET)
+   from a separate endpoint.
+
+{_BANNER}
+"""
+_SUMMARY_HEADER = f"""
+
+{_BANNER}
+FUTURES OPEN ORDERS SUMMARY
+{_BANNER}
+Total Open Orders:   {{total_orders}}
+Partially Filled:    {{partially_filled}}
+
+By Order Type:
+"""
+_SUMMARY_FOOTER = f"""
+{_BANNER}
+
+To cancel an order:
+  binance_cancel_futures_order(symbol="SYMBOL", order_id=ORDER_ID)
+
+To cancel all orders for a symbol:
+  binance_cancel_futures_order(symbol="SYMBOL", cancel_all=True)
+
+{_BANNER}
+"""
+
+# Order fields in output order, with the dtype of each DataFrame column
+# (price/stopPrice are NaN when Binance leaves them blank; time/updateTime
+# hold the raw milliseconds until they are formatted)
+OPEN_ORDER_DTYPES = {
+    'orderId': 'int64', 'clientOrderId': 'object', 'symbol': 'object', 'side': 'object',
+    'positionSide': 'object', 'type': 'object', 'timeInForce': 'object',
+    'price': 'float64', 'stopPrice': 'float64', 'origQty': 'float64', 'executedQty': 'float64',
+    'status': 'object', 'reduceOnly': 'bool', 'closePosition': 'bool', 'workingType': 'object',
+    'priceProtect': 'bool', 'time': 'object', 'updateTime': 'object'
+}
+
+
+def invalidate_open_orders_cache() -> None:
+    """Drop all cached open orders; call after placing or cancelling a futures order."""
+    global _cache_generation
+    with _cache_lock:
+        _open_orders_cache.clear()
+        _cache_generation += 1
+
+
+def _cached_open_orders(binance_client: Client, symbol: Optional[str]) -> list:
+    """Return the raw open futures orders for symbol (or all symbols), from the cache when it is fresh."""
+    # Binance symbols are upper case; normalise so the cache key and the
+    # all-symbols filter match what the live request returns
+    symbol = symbol.upper() if symbol else None
+    current_time = time.monotonic()
+    cache_ttl = min(float(os.getenv('BINANCE_OPEN_ORDERS_CACHE_TTL', '2')), _MAX_CACHE_TTL_SECONDS)
+
+    # Check if we can use cached data
+    with _cache_lock:
+        cached = _open_orders_cache.get(symbol)
+        if cached is not None and current_time - cached[0] < cache_ttl:
+            logger.info("Using cached futures open orders (age: %.1fs)", current_time - cached[0])
+            return cached[1]
+        cached_all = _open_orders_cache.get(None)
+        if symbol and cached_all is not None and current_time - cached_all[0] < cache_ttl:
+            logger.info("Using cached futures open orders for all symbols (age: %.1fs)", current_time - cached_all[0])
+            return [order for order in cached_all[1] if order['symbol'] == symbol]
+        generation = _cache_generation
+
+    # Fetch open orders
+    if symbol:
+        orders = binance_client.futures_get_open_orders(symbol=symbol)
+    else:
+        orders = binance_client.futures_get_open_orders()
+
+    # Update cache, unless an order was placed or cancelled while the request
+    # was in flight (the response may predate it)
+    with _cache_lock:
+        if _cache_generation == generation:
+            _open_orders_cache[symbol] = (current_time, orders)
+
+    return orders
+
+
+def _open_order_values(order: dict, blank_price=math.nan) -> tuple:
+    """Extract one order's output values in OPEN_ORDER_DTYPES order (timestamps still in milliseconds)."""
+    price = order['price']
+    stop_price = order['stopPrice']
+    return (
+        order['orderId'],
+        order['clientOrderId'],
+        order['symbol'],
+        order['side'],
+        order['positionSide'],
+        order['type'],
+        order['timeInForce'],
+        float(price) if price else blank_price,
+        float(stop_price) if stop_price else blank_price,
+        float(order['origQty']),
+        float(order['executedQty']),
+        order['status'],
+        order['reduceOnly'],
+        order['closePosition'],
+        order.get('workingType', 'CONTRACT_PRICE'),
+        order.get('priceProtect', False),
+        order['time'],
+        order['updateTime']
+    )
+
 
 @with_sentry_tracing("binance_get_futures_open_orders")
-def fetch_futures_open_orders(binance_client: Client, symbol: Optional[str] = None) -> pd.DataFrame:
+def fetch_futures_open_order_records(binance_client: Client, symbol: Optional[str] = None) -> List[dict]:
     """
-    Fetch open futures orders and return as DataFrame.
+    Fetch open futures orders as the raw records returned by Binance.
 
     Args:
         binance_client: Initialized Binance Client
         symbol: Optional trading pair symbol to filter (e.g., 'BTCUSDT')
 
     Returns:
-        DataFrame with open futures orders
+        List of order dicts as returned by futures_get_open_orders
 
     Note:
-        Returns all pending futures orders that haven't been filled or cancelled.
+        Responses are cached for BINANCE_OPEN_ORDERS_CACHE_TTL seconds
+        (default 2, at most 5); placing or cancelling an order clears the cache.
     """
     logger.info(f"Fetching futures open orders" + (f" for {symbol}" if symbol else ""))
 
     try:
-        # Fetch open orders
-        if symbol:
-            orders = binance_client.futures_get_open_orders(symbol=symbol)
-        else:
-            orders = binance_client.futures_get_open_orders()
-
-        records = []
-        for order in orders:
-            records.append({
-                'orderId': order['orderId'],
-                'clientOrderId': order['clientOrderId'],
-                'symbol': order['symbol'],
-                'side': order['side'],
-                'positionSide': order['positionSide'],
-                'type': order['type'],
-                'timeInForce': order['timeInForce'],
-                'price': float(order['price']) if order['price'] else None,
-                'stopPrice': float(order['stopPrice']) if order['stopPrice'] else None,
-                'origQty': float(order['origQty']),
-                'executedQty': float(order['executedQty']),
-                'status': order['status'],
-                'reduceOnly': order['reduceOnly'],
-                'closePosition': order['closePosition'],
-                'workingType': order.get('workingType', 'CONTRACT_PRICE'),
-                'priceProtect': order.get('priceProtect', False),
-                'time': datetime.fromtimestamp(order['time'] / 1000).strftime('%Y-%m-%d %H:%M:%S'),
-                'updateTime': datetime.fromtimestamp(order['updateTime'] / 1000).strftime('%Y-%m-%d %H:%M:%S')
-            })
-
-        df = pd.DataFrame(records) if records else pd.DataFrame(columns=[
-            'orderId', 'clientOrderId', 'symbol', 'side', 'positionSide', 'type', 'timeInForce',
-            'price', 'stopPrice', 'origQty', 'executedQty', 'status', 'reduceOnly',
-            'closePosition', 'workingType', 'priceProtect', 'time', 'updateTime'
-        ])
-
-        logger.info(f"Retrieved {len(records)} open futures orders")
-
-        return df
+        orders = _cached_open_orders(binance_client, symbol)
+        logger.info(f"Retrieved {len(orders)} open futures orders")
+        return orders
 
     except Exception as e:
         logger.error(f"Error fetching futures open orders: {e}")
         raise
 
 
+def _empty_open_orders_df() -> pd.DataFrame:
+    """Return a (shallow copy of a) typed, empty open orders frame, built once per process."""
+    global _empty_open_orders_template
+    if _empty_open_orders_template is None:
+        _empty_open_orders_template = pd.DataFrame(
+            {column: pd.Series(dtype=dtype) for column, dtype in OPEN_ORDER_DTYPES.items()}
+        )
+    return _empty_open_orders_template.copy(deep=False)
+
+
+def build_futures_open_orders_df(orders: List[dict]) -> pd.DataFrame:
+    """Build the open futures orders DataFrame from raw Binance order records."""
+    if not orders:
+        return _empty_open_orders_df()
+
+    # One pass builds a tuple per order (in OPEN_ORDER_DTYPES order);
+    # zip(*rows) then transposes them into one typed array per column
+    rows = [_open_order_values(order) for order in orders]
+
+    df = pd.DataFrame(
+        {
+            column: np.asarray(values, dtype=dtype)
+            for (column, dtype), values in zip(OPEN_ORDER_DTYPES.items(), zip(*rows))
+        },
+        copy=False
+    )
+
+    # Format both timestamp columns in one vectorized pass each
+    df['time'] = format_ms_timestamps(df['time'])
+    df['updateTime'] = format_ms_timestamps(df['updateTime'])
+
+    return df
+
+
+def build_futures_open_order_rows(orders: List[dict]) -> List[dict]:
+    """
+    Build the open futures order rows as plain dicts, without pandas.
+
+    Same columns and values as build_futures_open_orders_df; used for small
+    results where DataFrame setup costs more than the rows themselves.
+    """
+    rows = []
+    for order in orders:
+        row = dict(zip(OPEN_ORDER_DTYPES, _open_order_values(order, blank_price=None)))
+        row['time'] = format_ms_timestamp(row['time'])
+        row['updateTime'] = format_ms_timestamp(row['updateTime'])
+        rows.append(row)
+    return rows
+
+
+def fetch_futures_open_orders(binance_client: Client, symbol: Optional[str] = None) -> pd.DataFrame:
+    """
+    Fetch open futures orders and return as DataFrame.
+
+    Args:
+        binance_client: Initialized Binance Client
+        symbol: Optional trading pair symbol to filter (e.g., 'BTCUSDT')
+
+    Returns:
+        DataFrame with open futures orders
+
+    Note:
+        Returns all pending futures orders that haven't been filled or cancelled.
+        Responses are cached for BINANCE_OPEN_ORDERS_CACHE_TTL seconds
+        (default 2, at most 5); placing or cancelling an order clears the cache.
+    """
+    return build_futures_open_orders_df(fetch_futures_open_order_records(binance_client, symbol))
+
+
 def register_binance_get_futures_open_orders(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
     """Register the binance_get_futures_open_orders tool"""
     @local_mcp_instance.tool()
@@ -97,7 +273,8 @@ def register_binance_get_futures_open_orders(local_mcp_instance, local_binance_c
                 - If omitted: Shows all open futures orders across all symbols
 
         Returns:
-            str: Formatted response with CSV file containing all open futures orders.
+            str: Formatted response with CSV file containing all open futures orders,
+                or a short notice without a file when there are none.
 
         CSV Output Columns:
             - orderId (integer): Unique order identifier
@@ -196,11 +373,16 @@ def register_binance_get_futures_open_orders(local_mcp_instance, local_binance_c
 
         try:
             # Fetch open orders
-            df = fetch_futures_open_orders(
+            orders = fetch_futures_open_order_records(
                 binance_client=local_binance_client,
                 symbol=symbol
             )
 
+            # Nothing to save: skip the CSV file and its schema/sample section
+            if not orders:
+                scope = f"No basic orders (LIMIT/MARKET) found for {symbol}.\n" if symbol else "No basic futures orders (LIMIT/MARKET) found.\n"
+                return "".join((_NO_ORDERS_HEADER, scope, _NO_ORDERS_FOOTER))
+
             # Generate filename
             if symbol:
                 filename = f"futures_open_orders_{symbol}_{str(uuid.uuid4())[:8]}.csv"
@@ -209,88 +391,58 @@ def register_binance_get_futures_open_orders(local_mcp_instance, local_binance_c
 
             filepath = csv_dir / filename
 
-            # Save to CSV
-            df.to_csv(filepath, index=False)
-            logger.info(f"Saved futures open orders to {filename}")
-
-            # Return formatted response
-            result = format_csv_response(filepath, df)
-
-            if df.empty:
-                summary = f"""
-
-═══════════════════════════════════════════════════════════════════════════════
-NO OPEN BASIC FUTURES ORDERS
-═══════════════════════════════════════════════════════════════════════════════
-"""
-                if symbol:
-                    summary += f"No basic orders (LIMIT/MARKET) found for {symbol}.\n"
-                else:
-                    summary += "No basic futures orders (LIMIT/MARKET) found.\n"
-                summary += """
-💡 Looking for stop-loss or take-profit orders?
-   Use binance_get_futures_conditional_orders() instead!
-
-   Since December 2025, Binance serves conditional orders
-   (STOP_MARKET, TAKE_PROFIT_MARKET, TRAILING_STOP_MARKET)
-   from a separate endpoint.
+            if len(orders) <= SMALL_RESULT_MAX_ROWS:
+                # Few rows: write them straight with the csv module, no DataFrame
+                rows = build_futures_open_order_rows(orders)
+                file_size = write_csv_rows(filepath, OPEN_ORDER_DTYPES.keys(), (row.values() for row in rows))
+                result = format_csv_response(filepath, rows, file_size=file_size)
+            else:
+                df = build_futures_open_orders_df(orders)
 
-═══════════════════════════════════════════════════════════════════════════════
-"""
-                return result + summary
+                # Save to CSV with the stdlib csv writer (at most a few hundred rows)
+                file_size = write_csv_rows(filepath, df.columns, dataframe_rows(df))
 
-            # Calculate summary statistics
-            total_orders = len(df)
-            by_type = df['type'].value_counts().to_dict()
-            by_status = df['status'].value_counts().to_dict()
-            partially_filled = len(df[df['status'] == 'PARTIALLY_FILLED'])
+                # Return formatted response
+                result = format_csv_response(filepath, df, file_size=file_size)
 
-            summary = f"""
+            logger.info(f"Saved futures open orders to {filename}")
 
-═══════════════════════════════════════════════════════════════════════════════
-FUTURES OPEN ORDERS SUMMARY
-═══════════════════════════════════════════════════════════════════════════════
-Total Open Orders:   {total_orders}
-Partially Filled:    {partially_filled}
+            # Calculate summary statistics from the raw orders
+            total_orders = len(orders)
+            by_type = Counter(order['type'] for order in orders)
+            by_status = Counter(order['status'] for order in orders)
+            by_symbol = Counter(order['symbol'] for order in orders)
+            partially_filled = by_status['PARTIALLY_FILLED']
 
-By Order Type:
-"""
+            # Collect response pieces and join once at the end
+            parts = [result, _SUMMARY_HEADER.format(
+                total_orders=total_orders,
+                partially_filled=partially_filled
+            )]
 
             for order_type, count in sorted(by_type.items()):
-                summary += f"  {order_type}: {count}\n"
+                parts.append(f"  {order_type}: {count}\n")
 
-            summary += "\nBy Status:\n"
+            parts.append("\nBy Status:\n")
             for status, count in sorted(by_status.items()):
-                summary += f"  {status}: {count}\n"
+                parts.append(f"  {status}: {count}\n")
 
-            # List unique symbols
-            symbols = df['symbol'].unique()
-            summary += f"\nSymbols with Open Orders:\n"
-            for sym in sorted(symbols):
-                sym_count = len(df[df['symbol'] == sym])
-                summary += f"  {sym}: {sym_count} order(s)\n"
+            parts.append("\nSymbols with Open Orders:\n")
+            for sym, sym_count in sorted(by_symbol.items()):
+                parts.append(f"  {sym}: {sym_count} order(s)\n")
 
-            summary += """
-═══════════════════════════════════════════════════════════════════════════════
-
-To cancel an order:
-  binance_cancel_futures_order(symbol="SYMBOL", order_id=ORDER_ID)
-
-To cancel all orders for a symbol:
-  binance_cancel_futures_order(symbol="SYMBOL", cancel_all=True)
-
-═══════════════════════════════════════════════════════════════════════════════
-"""
+            parts.append(_SUMMARY_FOOTER)
+            response = "".join(parts)
 
             log_request(
                 requests_dir=requests_dir,
                 requester=requester,
                 tool_name="binance_get_futures_open_orders",
                 input_params={"symbol": symbol},
-                output_result=result + summary
+                output_result=response
             )
 
-            return result + summary
+            return response
 
         except Exception as e:
             logger.error(f"Error fetching futures open orders: {e}")
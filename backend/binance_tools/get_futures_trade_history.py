@@ -1,21 +1,46 @@
 import logging
-from datetime import datetime
 import uuid
-from mcp_service import format_csv_response
+from mcp_service import format_csv_response, format_ms_timestamp, format_ms_timestamps, write_csv_rows
 from request_logger import log_request
+import numpy as np
 import pandas as pd
 from binance.client import Client
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from sentry_utils import with_sentry_tracing
 
 logger = logging.getLogger(__name__)
 
+# Futures trade fields in output order
+FUTURES_TRADE_COLUMNS = [
+    'id', 'orderId', 'symbol', 'side', 'positionSide', 'price', 'qty', 'quoteQty',
+    'realizedPnl', 'commission', 'commissionAsset', 'buyer', 'maker', 'time'
+]
+FUTURES_TRADE_FLOAT_COLUMNS = ['price', 'qty', 'quoteQty', 'realizedPnl', 'commission']
+
+# Below this many trades, formatting timestamps one by one beats the fixed
+# cost of the vectorized pandas path
+VECTORIZED_TIMESTAMP_MIN_ROWS = 512
+
+
+def _format_trade_time(ms: int, formatted_seconds: Dict[int, str]) -> str:
+    """
+    Format a trade timestamp, reusing the text already built for its second.
+
+    Fills of one order usually share the same second, so each distinct second
+    is formatted once per call site.
+    """
+    second = ms // 1000
+    text = formatted_seconds.get(second)
+    if text is None:
+        text = formatted_seconds[second] = format_ms_timestamp(ms)
+    return text
+
 
 @with_sentry_tracing("binance_get_futures_trade_history")
-def fetch_futures_trade_history(binance_client: Client, symbol: str, limit: int = 100,
-                                from_id: Optional[int] = None) -> pd.DataFrame:
+def fetch_futures_trade_records(binance_client: Client, symbol: str, limit: int = 100,
+                                from_id: Optional[int] = None) -> List[dict]:
     """
-    Fetch futures trade history and return as DataFrame.
+    Fetch futures trade history as the raw records returned by Binance.
 
     Args:
         binance_client: Initialized Binance Client
@@ -24,10 +49,7 @@ def fetch_futures_trade_history(binance_client: Client, symbol: str, limit: int
         from_id: Trade ID to fetch from (optional, for pagination)
 
     Returns:
-        DataFrame with trade execution history
-
-    Note:
-        Returns historical completed trades (executions) for the symbol.
+        List of trade dicts as returned by futures_account_trades
     """
     logger.info(f"Fetching futures trade history for {symbol}")
 
@@ -44,39 +66,109 @@ def fetch_futures_trade_history(binance_client: Client, symbol: str, limit: int
         # Fetch trade history
         trades = binance_client.futures_account_trades(**params)
 
-        records = []
-        for trade in trades:
-            records.append({
-                'id': trade['id'],
-                'orderId': trade['orderId'],
-                'symbol': trade['symbol'],
-                'side': trade['side'],
-                'positionSide': trade['positionSide'],
-                'price': float(trade['price']),
-                'qty': float(trade['qty']),
-                'quoteQty': float(trade['quoteQty']),
-                'realizedPnl': float(trade['realizedPnl']),
-                'commission': float(trade['commission']),
-                'commissionAsset': trade['commissionAsset'],
-                'buyer': trade['buyer'],
-                'maker': trade['maker'],
-                'time': datetime.fromtimestamp(trade['time'] / 1000).strftime('%Y-%m-%d %H:%M:%S')
-            })
-
-        df = pd.DataFrame(records) if records else pd.DataFrame(columns=[
-            'id', 'orderId', 'symbol', 'side', 'positionSide', 'price', 'qty', 'quoteQty',
-            'realizedPnl', 'commission', 'commissionAsset', 'buyer', 'maker', 'time'
-        ])
-
-        logger.info(f"Retrieved {len(records)} futures trades for {symbol}")
-
-        return df
+        logger.info(f"Retrieved {len(trades)} futures trades for {symbol}")
+
+        return trades
 
     except Exception as e:
         logger.error(f"Error fetching futures trade history: {e}")
         raise
 
 
+def build_futures_trade_history_df(trades: List[dict]) -> pd.DataFrame:
+    """Build the futures trade history DataFrame from raw Binance trade records."""
+    # Build the frame column-wise: one pass over the records per field, with
+    # the numeric strings parsed straight into float64 arrays
+    columns = {column: [trade[column] for trade in trades] for column in FUTURES_TRADE_COLUMNS}
+    for column in FUTURES_TRADE_FLOAT_COLUMNS:
+        columns[column] = np.array(columns[column], dtype='float64')
+
+    # Convert timestamps to readable format
+    if len(trades) >= VECTORIZED_TIMESTAMP_MIN_ROWS:
+        columns['time'] = format_ms_timestamps(columns['time'])
+    else:
+        formatted_seconds = {}
+        columns['time'] = [_format_trade_time(ms, formatted_seconds) for ms in columns['time']]
+
+    return pd.DataFrame(columns, columns=FUTURES_TRADE_COLUMNS)
+
+
+def build_futures_trade_rows(trades: List[dict]) -> Tuple[List[tuple], Dict[str, float]]:
+    """
+    Build the futures trade CSV rows and summary totals in one pass, without pandas.
+
+    Rows hold the same values as build_futures_trade_history_df, in
+    FUTURES_TRADE_COLUMNS order.
+
+    Returns:
+        Tuple of (rows, totals), where totals holds the realizedPnl, commission
+        and quoteQty sums and the number of maker trades
+    """
+    rows = []
+    total_pnl = total_commission = total_volume = 0.0
+    maker_trades = 0
+    formatted_seconds = {}
+
+    for trade in trades:
+        quote_qty = float(trade['quoteQty'])
+        realized_pnl = float(trade['realizedPnl'])
+        commission = float(trade['commission'])
+        maker = trade['maker']
+
+        rows.append((
+            trade['id'],
+            trade['orderId'],
+            trade['symbol'],
+            trade['side'],
+            trade['positionSide'],
+            float(trade['price']),
+            float(trade['qty']),
+            quote_qty,
+            realized_pnl,
+            commission,
+            trade['commissionAsset'],
+            trade['buyer'],
+            maker,
+            _format_trade_time(trade['time'], formatted_seconds)
+        ))
+
+        total_volume += quote_qty
+        total_pnl += realized_pnl
+        total_commission += commission
+        if maker:
+            maker_trades += 1
+
+    totals = {
+        'realizedPnl': total_pnl,
+        'commission': total_commission,
+        'quoteQty': total_volume,
+        'maker': maker_trades
+    }
+    return rows, totals
+
+
+def fetch_futures_trade_history(binance_client: Client, symbol: str, limit: int = 100,
+                                from_id: Optional[int] = None) -> pd.DataFrame:
+    """
+    Fetch futures trade history and return as DataFrame.
+
+    Args:
+        binance_client: Initialized Binance Client
+        symbol: Trading pair symbol (e.g., 'BTCUSDT')
+        limit: Number of trades to fetch (max 1000, default 100)
+        from_id: Trade ID to fetch from (optional, for pagination)
+
+    Returns:
+        DataFrame with trade execution history
+
+    Note:
+        Returns historical completed trades (executions) for the symbol.
+    """
+    return build_futures_trade_history_df(
+        fetch_futures_trade_records(binance_client, symbol, limit=limit, from_id=from_id)
+    )
+
+
 def register_binance_get_futures_trade_history(local_mcp_instance, local_binance_client, csv_dir, requests_dir):
     """Register the binance_get_futures_trade_history tool"""
     @local_mcp_instance.tool()
@@ -238,7 +330,7 @@ def register_binance_get_futures_trade_history(local_mcp_instance, local_binance
 
         try:
             # Fetch trade history
-            df = fetch_futures_trade_history(
+            trades = fetch_futures_trade_records(
                 binance_client=local_binance_client,
                 symbol=symbol,
                 limit=limit,
@@ -249,12 +341,19 @@ def register_binance_get_futures_trade_history(local_mcp_instance, local_binance
             filename = f"futures_trades_{symbol}_{str(uuid.uuid4())[:8]}.csv"
             filepath = csv_dir / filename
 
-            # Save to CSV
-            df.to_csv(filepath, index=False)
+            # Build the CSV rows and the summary totals in a single pass over
+            # the API records and write them directly, without a DataFrame
+            rows, totals = build_futures_trade_rows(trades)
+            file_size = write_csv_rows(filepath, FUTURES_TRADE_COLUMNS, rows)
             logger.info(f"Saved futures trade history to {filename}")
 
-            # Return formatted response
-            result = format_csv_response(filepath, df)
+            # Return formatted response (schema and sample come from the first row;
+            # an empty frame still lists the columns when there are no trades)
+            if rows:
+                sample = [dict(zip(FUTURES_TRADE_COLUMNS, rows[0]))]
+            else:
+                sample = pd.DataFrame(columns=FUTURES_TRADE_COLUMNS)
+            result = format_csv_response(filepath, sample, file_size=file_size, row_count=len(rows))
 
             # Log request
             log_request(
@@ -269,7 +368,7 @@ def register_binance_get_futures_trade_history(local_mcp_instance, local_binance
                 output_result=result
             )
 
-            if df.empty:
+            if not rows:
                 summary = f"""
 
 ═══════════════════════════════════════════════════════════════════════════════
@@ -287,13 +386,17 @@ This could mean:
                 return result + summary
 
             # Calculate summary statistics
-            total_trades = len(df)
-            total_pnl = df['realizedPnl'].sum()
-            total_commission = df['commission'].sum()
+            total_trades = len(rows)
+            total_pnl = totals['realizedPnl']
+            total_commission = totals['commission']
             net_pnl = total_pnl - total_commission
-            total_volume = df['quoteQty'].sum()
-            maker_trades = df['maker'].sum()
+            total_volume = totals['quoteQty']
+            maker_trades = totals['maker']
             maker_pct = (maker_trades / total_trades) * 100 if total_trades > 0 else 0
+            taker_trades = total_trades - maker_trades
+            taker_pct = 100 - maker_pct
+            # Rows keep the API order; id is the first column and time the last
+            first_trade, latest_trade = rows[-1], rows[0]
 
             summary = f"""
 
@@ -310,12 +413,12 @@ Total Fees:          {total_commission:,.2f} USDT
 Net P&L (after fees): {net_pnl:+,.2f} USDT
 
 Trading Style:
-Maker Trades:        {int(maker_trades)} ({maker_pct:.1f}%)
-Taker Trades:        {total_trades - int(maker_trades)} ({100-maker_pct:.1f}%)
+Maker Trades:        {maker_trades} ({maker_pct:.1f}%)
+Taker Trades:        {taker_trades} ({taker_pct:.1f}%)
 
 Date Range:
-First Trade:         {df.iloc[-1]['time']}
-Latest Trade:        {df.iloc[0]['time']}
+First Trade:         {first_trade[-1]}
+Latest Trade:        {latest_trade[-1]}
 ═══════════════════════════════════════════════════════════════════════════════
 
 Use py_eval to perform detailed analysis:
@@ -328,7 +431,7 @@ To get more trades:
   binance_get_futures_trade_history(symbol="{symbol}", limit=500)
 
 To get older trades (pagination):
-  binance_get_futures_trade_history(symbol="{symbol}", from_id={df.iloc[-1]['id']})
+  binance_get_futures_trade_history(symbol="{symbol}", from_id={first_trade[0]})
 
 ═══════════════════════════════════════════════════════════════════════════════
 """
@@ -1,14 +1,79 @@
 import logging
+import os
+import time
 from datetime import datetime, timedelta
 import uuid
-from mcp_service import format_csv_response
+from mcp_service import format_csv_response, format_ms_timestamps
 from request_logger import log_request
+import numpy as np
 import pandas as pd
 from binance.client import Client
 from sentry_utils import with_sentry_tracing
 
 logger = logging.getLogger(__name__)
 
+# Output columns of the klines frame
+KLINE_COLUMNS = [
+    'open_time', 'open_time_readable', 'open', 'high', 'low', 'close', 'volume',
+    'close_time', 'close_time_readable', 'quote_volume', 'num_trades',
+    'taker_buy_base_volume', 'taker_buy_quote_volume'
+]
+# Positions of the float fields in a raw kline
+# (open, high, low, close, volume, quote_volume, taker_buy_base_volume, taker_buy_quote_volume)
+KLINE_FLOAT_FIELDS = [1, 2, 3, 4, 5, 7, 9, 10]
+
+# Parsed klines per (symbol, interval, start date), so dashboards re-polling
+# the same history skip both the API call and the parsing
+# Format: {(symbol, interval, start_str): (expires_at, df)}
+_klines_cache = {}
+
+# Seconds per kline interval unit ('1m', '4h', '1d', '1w', '1M', ...)
+_INTERVAL_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800, 'M': 2592000}
+
+
+def _klines_cache_ttl(interval: str) -> float:
+    """
+    Seconds to reuse parsed klines: BINANCE_KLINES_CACHE_TTL, capped at half an
+    interval so the latest (still open) candle is never more than that stale.
+    """
+    cache_ttl = float(os.getenv('BINANCE_KLINES_CACHE_TTL', '60'))
+    try:
+        interval_seconds = int(interval[:-1]) * _INTERVAL_UNIT_SECONDS[interval[-1]]
+    except (ValueError, KeyError):
+        return 0
+    return min(cache_ttl, interval_seconds / 2)
+
+
+def build_klines_df(klines: list) -> pd.DataFrame:
+    """Build the klines DataFrame (see fetch_historical_klines) from raw Binance klines."""
+    if not klines:
+        return pd.DataFrame(columns=KLINE_COLUMNS)
+
+    # Convert the klines to a 2-D array once and cast whole columns at a time
+    # instead of converting each field of each kline separately
+    arr = np.array(klines, dtype=object)
+    open_time = arr[:, 0].astype('int64')
+    close_time = arr[:, 6].astype('int64')
+    floats = arr[:, KLINE_FLOAT_FIELDS].astype('float64')
+
+    df = pd.DataFrame({
+        'open_time': open_time,
+        'open_time_readable': format_ms_timestamps(open_time),
+        'open': floats[:, 0],
+        'high': floats[:, 1],
+        'low': floats[:, 2],
+        'close': floats[:, 3],
+        'volume': floats[:, 4],
+        'close_time': close_time,
+        'close_time_readable': format_ms_timestamps(close_time),
+        'quote_volume': floats[:, 5],
+        'num_trades': arr[:, 8].astype('int64'),
+        'taker_buy_base_volume': floats[:, 6],
+        'taker_buy_quote_volume': floats[:, 7]
+    })
+
+    return df
+
 
 @with_sentry_tracing("binance_get_historical_klines")
 def fetch_historical_klines(
@@ -45,14 +110,24 @@ def fetch_historical_klines(
     Note:
         This provides historical OHLCV data for technical analysis and backtesting.
         Use this to get accurate historical prices at specific timestamps.
+        Results are cached for BINANCE_KLINES_CACHE_TTL seconds (default 60,
+        at most half the kline interval).
     """
+    # Calculate start time (days ago from now)
+    start_time = datetime.now() - timedelta(days=days)
+    start_str = start_time.strftime('%Y-%m-%d')
+
+    # Check if we can use cached data
+    cache_key = (symbol, interval, start_str)
+    current_time = time.monotonic()
+    cached = _klines_cache.get(cache_key)
+    if cached is not None and current_time < cached[0]:
+        logger.info(f"Using cached historical klines for {symbol}, interval={interval}, days={days}")
+        return cached[1].copy()
+
     logger.info(f"Fetching historical klines for {symbol}, interval={interval}, days={days}")
 
     try:
-        # Calculate start time (days ago from now)
-        start_time = datetime.now() - timedelta(days=days)
-        start_str = start_time.strftime('%Y-%m-%d')
-
         # Fetch historical klines from Binance API
         klines = binance_client.get_historical_klines(
             symbol=symbol,
@@ -60,37 +135,21 @@ def fetch_historical_klines(
             start_str=start_str
         )
 
-        # Process klines into records
-        records = []
-        for kline in klines:
-            open_time = int(kline[0])
-            close_time = int(kline[6])
-
-            record = {
-                'open_time': open_time,
-                'open_time_readable': datetime.fromtimestamp(open_time / 1000).strftime('%Y-%m-%d %H:%M:%S'),
-                'open': float(kline[1]),
-                'high': float(kline[2]),
-                'low': float(kline[3]),
-                'close': float(kline[4]),
-                'volume': float(kline[5]),
-                'close_time': close_time,
-                'close_time_readable': datetime.fromtimestamp(close_time / 1000).strftime('%Y-%m-%d %H:%M:%S'),
-                'quote_volume': float(kline[7]),
-                'num_trades': int(kline[8]),
-                'taker_buy_base_volume': float(kline[9]),
-                'taker_buy_quote_volume': float(kline[10])
-            }
-            records.append(record)
-
-        logger.info(f"Successfully fetched {len(records)} klines for {symbol}")
+        logger.info(f"Successfully fetched {len(klines)} klines for {symbol}")
 
     except Exception as e:
         logger.error(f"Error fetching historical klines from Binance API: {e}")
         raise
 
-    # Create DataFrame
-    df = pd.DataFrame(records)
+    df = build_klines_df(klines)
+
+    # Update cache, dropping expired entries so old histories do not pile up
+    cache_ttl = _klines_cache_ttl(interval)
+    if cache_ttl > 0:
+        for key, (expires_at, _) in list(_klines_cache.items()):
+            if expires_at <= current_time:
+                _klines_cache.pop(key, None)
+        _klines_cache[cache_key] = (current_time + cache_ttl, df.copy())
 
     return df
 
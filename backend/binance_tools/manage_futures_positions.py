@@ -8,6 +8,9 @@ import pandas as pd
 from binance.client import Client
 from typing import Optional
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_futures_balances import invalidate_futures_balances_cache
+from binance_tools.get_futures_conditional_orders import invalidate_conditional_orders_cache
+from binance_tools.get_futures_open_orders import invalidate_open_orders_cache
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +191,11 @@ def close_futures_position(binance_client: Client, symbol: str, position_side: s
             positionSide=position_side,
             reduceOnly=True
         )
+        # Cached positions, balances and orders predate the close (Binance also
+        # cancels closePosition TP/SL orders once the position is flat)
+        invalidate_futures_balances_cache()
+        invalidate_conditional_orders_cache()
+        invalidate_open_orders_cache()
 
         # Get post-close position (should be zero)
         positions_after = binance_client.futures_position_information(symbol=symbol)
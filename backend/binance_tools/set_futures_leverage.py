@@ -8,6 +8,7 @@ import pandas as pd
 from binance.client import Client
 from typing import Optional
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_futures_balances import invalidate_futures_balances_cache
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,8 @@ def set_leverage_operation(binance_client: Client, symbol: str, leverage: int) -
         # Set leverage
         logger.warning(f"⚠️  SETTING LEVERAGE: {symbol} to {leverage}x")
         result = binance_client.futures_change_leverage(symbol=symbol, leverage=leverage)
+        # Cached positions still show the old leverage
+        invalidate_futures_balances_cache()
 
         # Calculate risk level
         if leverage >= 75:
@@ -7,6 +7,7 @@ from request_logger import log_request
 import pandas as pd
 from binance.client import Client
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_account import invalidate_account_cache
 from binance_tools.validation_helpers import validate_and_adjust_quantity, create_lot_size_error_message
 
 logger = logging.getLogger(__name__)
@@ -84,6 +85,8 @@ def execute_limit_order(binance_client: Client, symbol: str, side: str,
             price=price,
             timeInForce=time_in_force
         )
+        # Any cached account balances predate this order's fills and locked funds
+        invalidate_account_cache()
         logger.info(f"Limit order placed successfully. Order ID: {order['orderId']}, Status: {order['status']}")
 
         # Count fills
@@ -8,6 +8,7 @@ import pandas as pd
 from binance.client import Client
 from typing import Optional
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_account import invalidate_account_cache
 from binance_tools.validation_helpers import validate_and_adjust_quantity, create_lot_size_error_message, format_decimal
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,8 @@ def execute_market_order(binance_client: Client, symbol: str, side: str,
         # Execute the order
         logger.warning(f"⚠️  EXECUTING REAL MARKET ORDER: {side} {symbol}")
         order = binance_client.order_market(**order_params)
+        # Any cached account balances predate this fill
+        invalidate_account_cache()
         logger.info(f"Order executed successfully. Order ID: {order['orderId']}")
 
         # Calculate execution details
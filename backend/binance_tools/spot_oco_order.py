@@ -8,6 +8,7 @@ import pandas as pd
 from binance.client import Client
 from typing import Optional
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_account import invalidate_account_cache
 from binance_tools.validation_helpers import validate_and_adjust_quantity, create_lot_size_error_message, format_decimal
 import json
 
@@ -115,6 +116,8 @@ def execute_oco_order(binance_client: Client, symbol: str, side: str, quantity:
                 abovePrice=format_decimal(stop_limit_price),
                 aboveTimeInForce=time_in_force
             )
+        # Any cached account balances predate the funds this order locks
+        invalidate_account_cache()
         logger.info(f"OCO order placed successfully. Order List ID: {order['orderListId']}")
 
         # Extract order details
@@ -7,6 +7,8 @@ from request_logger import log_request
 import pandas as pd
 from binance.client import Client
 from sentry_utils import with_sentry_tracing
+from binance_tools.get_futures_balances import invalidate_futures_balances_cache
+from binance_tools.get_futures_open_orders import invalidate_open_orders_cache
 from .validation_helpers import validate_futures_margin
 
 logger = logging.getLogger(__name__)
@@ -85,6 +87,10 @@ def execute_futures_market_order(binance_client: Client, symbol: str, side: str,
 
         logger.warning(f"⚠️  EXECUTING REAL FUTURES ORDER: {side} {quantity} {symbol} {position_side}")
         order = binance_client.futures_create_order(**params)
+        # Cached positions and balances predate this fill, and an order that
+        # did not fill immediately is missing from cached open orders
+        invalidate_futures_balances_cache()
+        invalidate_open_orders_cache()
         logger.info(f"Futures order executed. Order ID: {order['orderId']}")
 
         # Get updated position
@@ -16,7 +16,7 @@ from starlette.routing import Mount
 from starlette.staticfiles import StaticFiles
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
-from binance.client import Client
+from binance_client import FastJsonClient
 from mcp_service import register_py_eval, register_tool_notes, register_request_log
 from mcp_resources import register_mcp_resources
 from binance_tools.get_account import register_binance_get_account
@@ -25,6 +25,8 @@ from binance_tools.get_orderbook import register_binance_get_orderbook
 from binance_tools.get_recent_trades import register_binance_get_recent_trades
 from binance_tools.get_price import register_binance_get_price
 from binance_tools.get_book_ticker import register_binance_get_book_ticker
+from binance_tools.get_book_tickers import register_binance_get_book_tickers
+from binance_tools.get_book_tickers_parallel import register_binance_get_book_tickers_parallel
 from binance_tools.get_avg_price import register_binance_get_avg_price
 from binance_tools.get_open_orders import register_binance_get_open_orders
 from binance_tools.spot_trade_history import register_binance_spot_trade_history
@@ -150,7 +152,7 @@ binance_client = None
 if BINANCE_API_KEY and BINANCE_API_SECRET:
     try:
         logger.info(f"BINANCE_API_KEY: {BINANCE_API_KEY[:5]}... (truncated for security)")
-        binance_client = Client(BINANCE_API_KEY, BINANCE_API_SECRET)
+        binance_client = FastJsonClient(BINANCE_API_KEY, BINANCE_API_SECRET)
         logger.info("Binance Client initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize Binance Client: {e}")
@@ -209,6 +211,8 @@ register_binance_get_orderbook(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
 register_binance_get_recent_trades(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
 register_binance_get_price(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
 register_binance_get_book_ticker(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
+register_binance_get_book_tickers(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
+register_binance_get_book_tickers_parallel(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
 register_binance_get_avg_price(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
 register_binance_get_open_orders(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
 register_binance_spot_trade_history(mcp, binance_client, CSV_DIR, REQUESTS_DIR)
@@ -1,5 +1,13 @@
+import csv
+import functools
+import hashlib
+import itertools
+import numbers
 import pathlib
-from typing import Any, Dict
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 import json
 import logging
@@ -18,6 +26,27 @@ from request_logger import log_request
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Memoized format_csv_response output keyed by (path, mtime_ns), oldest evicted first
+_CSV_RESPONSE_CACHE_SIZE = 256
+_csv_response_cache = OrderedDict()
+
+# Process-start stamp plus a per-process counter: unique, sortable CSV filename
+# suffixes without reading OS entropy on every tool call
+_FILE_SUFFIX_PREFIX = f"{time.time_ns() // 1_000_000:x}"
+_file_suffix_counter = itertools.count()
+
+# Background pool for CSV writes so disk I/O overlaps response formatting
+_CSV_WRITE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='csv-write')
+
+# UTC offset changes (DST transitions) always fall on a quarter-hour boundary
+_QUARTER_HOUR_MS = 15 * 60 * 1000
+
+
+def unique_file_suffix() -> str:
+    """Return a short suffix that is unique across tool calls and server restarts."""
+    return f"{_FILE_SUFFIX_PREFIX}_{next(_file_suffix_counter):06x}"
+
+
 # Infer better data types for schema
 def infer_better_type(series):
     """Infer a more descriptive data type for a pandas Series."""
@@ -39,9 +68,12 @@ def infer_better_type(series):
         return 'boolean'
     if 'datetime' in dtype_str:
         return 'datetime'
+    if dtype_str == 'category':
+        # Categorical label columns are written to CSV as plain text
+        return 'string'
 
-    # Try to infer better types for 'object' columns
-    if dtype_str == 'object':
+    # Try to infer better types for text columns ('object', or 'str' on pandas 3)
+    if dtype_str in ('object', 'str', 'string'):
         # Try boolean
         if non_null.isin([0, 1, '0', '1', True, False, 'True', 'False', 'true', 'false']).all():
             return 'boolean'
@@ -73,6 +105,94 @@ def infer_better_type(series):
     return dtype_str
 
 
+@functools.lru_cache(maxsize=4096)
+def _infer_object_column_type(typed_values: tuple) -> str:
+    """infer_better_type for a column holding text, memoized per distinct (type, value) column."""
+    return infer_better_type(pd.Series([value for _, value in typed_values]))
+
+
+def infer_values_type(values: list) -> str:
+    """
+    Infer the schema type of a column given as a plain list of values.
+
+    Returns the label infer_better_type would give pd.Series(values). Columns
+    of Python numbers or booleans are classified directly; columns holding
+    text depend on pandas' own numeric and datetime parsing, so they go
+    through infer_better_type (memoized, so repeated responses skip pandas).
+    """
+    # Drop None and NaN (the only value not equal to itself), like dropna()
+    non_null = [value for value in values if value is not None and value == value]
+    if not non_null:
+        return "string (empty)"
+
+    if all(isinstance(value, (bool, np.bool_)) for value in non_null):
+        return 'boolean'
+
+    if all(isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_)) for value in non_null) \
+            and all(-2 ** 63 <= value < 2 ** 63 for value in non_null if isinstance(value, numbers.Integral)):
+        # Integers stay int64 unless a missing value makes pandas upcast to float64
+        if len(non_null) == len(values) and all(isinstance(value, numbers.Integral) for value in non_null):
+            return 'int64'
+        return 'float64'
+
+    return _infer_object_column_type(tuple((type(value), value) for value in values))
+
+
+def infer_record_types(records: list) -> Dict[str, str]:
+    """
+    Infer the schema of record-based responses (a list of row dicts).
+
+    Each column is inferred from all of its values with infer_values_type, so
+    the schema matches what the same rows would report as a DataFrame,
+    regardless of row count or which row holds a missing value.
+    """
+    columns = records[0].keys() if records else ()
+    return {col: infer_values_type([record.get(col) for record in records]) for col in columns}
+
+
+def format_ms_timestamp(ms) -> str:
+    """
+    Format one millisecond epoch timestamp as 'YYYY-MM-DD HH:MM:SS' local time.
+
+    Builds the string from the datetime fields directly, which is several times
+    faster than datetime.strftime for this fixed layout.
+    """
+    dt = datetime.fromtimestamp(int(ms) / 1000)
+    return f"{dt.year:04}-{dt.month:02}-{dt.day:02} {dt.hour:02}:{dt.minute:02}:{dt.second:02}"
+
+
+def format_ms_timestamps(values, fmt: str = '%Y-%m-%d %H:%M:%S', blank_zero: bool = False) -> pd.Series:
+    """
+    Format millisecond epoch timestamps as local-time strings in one vectorized pass.
+
+    Produces the same text as datetime.fromtimestamp(ms / 1000).strftime(fmt)
+    per value, including the 1970 date for a zero timestamp. Missing
+    timestamps become None; with blank_zero, zero ones do too (for fields
+    where the API uses 0 to mean "not set").
+    """
+    ms = pd.to_numeric(pd.Series(values), errors='coerce')
+    missing = ms.isna()
+    if blank_zero:
+        missing |= ms == 0
+
+    if not time.daylight:
+        # Fixed local offset (e.g. UTC containers): shift and format the whole column at once
+        formatted = pd.to_datetime(ms - time.timezone * 1000, unit='ms').dt.strftime(fmt)
+    else:
+        # Local zone observes DST, so the offset depends on the date. Offsets only
+        # change on quarter-hour boundaries: look one up per distinct quarter hour,
+        # then shift and format the whole column at once
+        quarters = (ms.fillna(0) // _QUARTER_HOUR_MS).to_numpy(dtype='int64')
+        unique_quarters, inverse = np.unique(quarters, return_inverse=True)
+        offsets_ms = np.array(
+            [time.localtime(quarter * _QUARTER_HOUR_MS // 1000).tm_gmtoff for quarter in unique_quarters],
+            dtype='int64'
+        ) * 1000
+        formatted = pd.to_datetime(ms + offsets_ms[inverse], unit='ms').dt.strftime(fmt)
+
+    return formatted.astype(object).where(~missing, None)
+
+
 def _posix_time_limit(seconds: float):
     """POSIX-only wall clock timeout using signals; noop elsewhere."""
     class _TL:
@@ -93,13 +213,132 @@ def _posix_time_limit(seconds: float):
     return _TL()
 
 
-def format_csv_response(filepath: pathlib.Path, df: Any) -> str:
+def _serialize_csv_rows(columns: Iterable[str], rows: Iterable[Iterable[Any]]) -> bytes:
+    """Render a header and rows as UTF-8 CSV bytes, matching DataFrame.to_csv(index=False)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def write_csv_rows(filepath: pathlib.Path, columns: Iterable[str], rows: Iterable[Iterable[Any]]) -> int:
+    """
+    Write rows to a CSV file with the stdlib csv writer, bypassing pandas.
+
+    Intended for small outputs where pandas' CSV engine setup dominates.
+    Output matches DataFrame.to_csv(index=False) for plain scalar values.
+
+    Args:
+        filepath: Destination CSV path
+        columns: Header row
+        rows: Data rows, one iterable of values per row
+
+    Returns:
+        Number of bytes written (can be passed to format_csv_response as file_size)
+    """
+    data = _serialize_csv_rows(columns, rows)
+    filepath.write_bytes(data)
+    return len(data)
+
+
+def submit_csv_write(filepath: Union[str, pathlib.Path], df: Any) -> Tuple[Future, int]:
+    """
+    Serialize a DataFrame to CSV and write it to disk on a background thread.
+
+    The caller can build its response while the write is in flight, and must
+    call .result() on the returned future before handing the file to anyone.
+
+    Args:
+        filepath: Destination CSV path
+        df: DataFrame to save (written with index=False)
+
+    Returns:
+        Tuple of (write future, size in bytes); the size can be passed to
+        format_csv_response as file_size
+    """
+    csv_bytes = df.to_csv(index=False).encode('utf-8')
+    return _CSV_WRITE_POOL.submit(pathlib.Path(filepath).write_bytes, csv_bytes), len(csv_bytes)
+
+
+def submit_csv_rows_write(filepath: Union[str, pathlib.Path], columns: Iterable[str],
+                          rows: Iterable[Iterable[Any]]) -> Tuple[Future, int]:
+    """
+    Serialize rows with the stdlib csv writer and write them on a background thread.
+
+    Like submit_csv_write, but skips pandas' CSV engine, which dominates the
+    cost for outputs of a few rows to a few hundred rows.
+
+    Args:
+        filepath: Destination CSV path
+        columns: Header row
+        rows: Data rows, one iterable of values per row
+
+    Returns:
+        Tuple of (write future, size in bytes)
+    """
+    csv_bytes = _serialize_csv_rows(columns, rows)
+    return _CSV_WRITE_POOL.submit(pathlib.Path(filepath).write_bytes, csv_bytes), len(csv_bytes)
+
+
+def dataframe_rows(df: Any) -> Iterable[Tuple[Any, ...]]:
+    """
+    Return a DataFrame's rows as plain tuples for write_csv_rows/submit_csv_rows_write.
+
+    Missing values become None so they are written as empty fields, as
+    DataFrame.to_csv does.
+    """
+    if df.isna().values.any():
+        df = df.astype(object).where(df.notna(), None)
+    return df.itertuples(index=False, name=None)
+
+
+def write_csv_rows_deduplicated(csv_dir: pathlib.Path, prefix: str, columns: Iterable[str],
+                                rows: Iterable[Iterable[Any]]) -> Tuple[pathlib.Path, int]:
+    """
+    Write rows to a content-addressed CSV file named '<prefix>_<hash>.csv'.
+
+    Identical payloads map to the same file, so repeated calls returning the
+    same data reuse the existing file instead of writing a new copy.
+
+    Args:
+        csv_dir: Directory for CSV files
+        prefix: Filename prefix (e.g., 'avg_price_BTCUSDT')
+        columns: Header row
+        rows: Data rows, one iterable of values per row
+
+    Returns:
+        Tuple of (filepath, size in bytes)
+    """
+    data = _serialize_csv_rows(columns, rows)
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    filepath = csv_dir / f"{prefix}_{digest}.csv"
+    if not filepath.exists():
+        # Write to a private temp file and rename it into place, so the
+        # content-addressed name only ever points at a complete file, even
+        # with concurrent writers or a crash mid-write
+        tmp_path = csv_dir / f".{filepath.name}.{uuid.uuid4().hex}.tmp"
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, filepath)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return filepath, len(data)
+
+
+def format_csv_response(filepath: Union[str, pathlib.Path], df: Any,
+                        file_size: Optional[int] = None,
+                        row_count: Optional[int] = None) -> str:
     """
     Generate standardized response format for CSV data files.
 
     Args:
-        filepath: Path to the saved CSV file
-        df: DataFrame that was saved
+        filepath: Path to the saved CSV file (a Path or a plain string path)
+        df: DataFrame that was saved, or a list of record dicts for small
+            responses that never build a DataFrame
+        file_size: Size of the written file in bytes, if already known (skips the stat call)
+        row_count: Number of data rows written, if already known (defaults to len(df))
 
     Returns:
         Formatted string with file info, schema, sample data, and Python snippet
@@ -118,12 +357,17 @@ def format_csv_response(filepath: pathlib.Path, df: Any) -> str:
         # Log DataFrame columns if available
         if hasattr(df, 'columns'):
             logger.info(f"DataFrame columns: {list(df.columns)}")
+        elif isinstance(df, list):
+            logger.info(f"Record columns: {list(df[0].keys()) if df else []}")
         else:
             logger.warning("DataFrame has no 'columns' attribute")
 
         # Get file size
-        logger.info("Getting file size...")
-        file_size_bytes = filepath.stat().st_size
+        if file_size is not None:
+            file_size_bytes = file_size
+        else:
+            logger.info("Getting file size...")
+            file_size_bytes = os.stat(filepath).st_size
         logger.info(f"File size: {file_size_bytes} bytes")
         
         if file_size_bytes < 1024:
@@ -136,22 +380,29 @@ def format_csv_response(filepath: pathlib.Path, df: Any) -> str:
         logger.info(f"Formatted file size: {size_str}")
 
         # Get filename only (relative to CSV_PATH)
-        filename = filepath.name
+        filename = os.path.basename(filepath)
         logger.info(f"Filename: {filename}")
 
         # Build schema JSON with inferred types
         logger.info("Building schema...")
-        schema = {col: infer_better_type(df[col]) for col in df.columns}
+        if isinstance(df, list):
+            schema = infer_record_types(df)
+        else:
+            schema = {col: infer_better_type(df[col]) for col in df.columns}
         schema_json = json.dumps(schema, indent=2)
         logger.info(f"Schema generated with {len(schema)} columns")
 
         # Generate sample data (first row) as markdown table
         logger.info("Generating sample data table...")
         if len(df) > 0:
-            sample_df = df.head(1)
             # Create markdown table manually for better control
-            headers = list(sample_df.columns)
-            values = [str(v) for v in sample_df.iloc[0].values]
+            if isinstance(df, list):
+                headers = list(df[0].keys())
+                values = [str(v) for v in df[0].values()]
+            else:
+                sample_df = df.head(1)
+                headers = list(sample_df.columns)
+                values = [str(v) for v in sample_df.iloc[0].values]
 
             # Truncate long values for display
             values = [v[:50] + "..." if len(v) > 50 else v for v in values]
@@ -173,12 +424,15 @@ df = pd.read_csv('data/mcp-binance/{filename}')
 print(df.info())
 print(df.head())"""
 
+        if row_count is None:
+            row_count = len(df)
+
         # Build final response
         logger.info("Building final response...")
         response = f"""✓ Data saved to CSV
 
 File: {filename}
-Rows: {len(df)}
+Rows: {row_count}
 Size: {size_str}
 
 Schema (JSON):
@@ -202,6 +456,35 @@ Python snippet to load:
         raise
 
 
+def format_csv_response_cached(filepath: pathlib.Path, df: Any) -> str:
+    """
+    Memoized format_csv_response for files that are often returned unchanged.
+
+    The response is cached per (path, mtime), so a content-addressed file that
+    was reused instead of rewritten skips schema inference and table building.
+    A rewritten file gets a new mtime and is formatted again.
+
+    Args:
+        filepath: Path to the saved CSV file
+        df: DataFrame or list of record dicts that was saved
+
+    Returns:
+        Formatted string with file info, schema, sample data, and Python snippet
+    """
+    stat = filepath.stat()
+    key = (str(filepath), stat.st_mtime_ns)
+    response = _csv_response_cache.get(key)
+    if response is not None:
+        logger.info(f"Using cached response for {filepath.name}")
+        return response
+
+    response = format_csv_response(filepath, df, file_size=stat.st_size)
+    _csv_response_cache[key] = response
+    if len(_csv_response_cache) > _CSV_RESPONSE_CACHE_SIZE:
+        _csv_response_cache.popitem(last=False)
+    return response
+
+
 def register_py_eval(local_mcp_instance, csv_dir, requests_dir):
     """Register the py_eval tool for Python code execution"""
     @local_mcp_instance.tool()